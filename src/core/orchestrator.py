@@ -211,16 +211,16 @@ class Orchestrator:
    • Temperature: {agent.config.get('llm', {}).get('temperature', 'N/A')}
 
 📝 COMMANDES DISPONIBLES
-{chr(10).join(f'   • /{cmd}' for cmd in agent.commands.keys()) or '   Aucune'}
+{chr(10).join(f'   • /{cmd}' for cmd, _ in agent.commands) or '   Aucune'}
 
 📚 BASE DE CONNAISSANCES
-{chr(10).join(f'   • {f}' for f in agent.knowledge.keys()) or '   Aucune'}
+{chr(10).join(f'   • {f}' for f, _ in agent.knowledge) or '   Aucune'}
 
 🔒 RÈGLES APPLIQUÉES
 {chr(10).join(f'   • {r}' for r in agent.rules.keys()) or '   Aucune'}
 
 🔗 HOOKS MÉTRIQUES
-{chr(10).join(f'   • {h}' for h in agent.hooks.keys()) or '   Aucun'}
+{chr(10).join(f'   • {h}' for h, _ in agent.hooks) or '   Aucun'}
 
 ══════════════════════════════════════════════════════════════
 """
@@ -291,7 +291,7 @@ class Orchestrator:
    3. Pointez vers: {agent_dir}/config.json
 
 📋 COMMANDES DISPONIBLES:
-{chr(10).join(f'   /{cmd}' for cmd in self.state.generated_agent.commands.keys())}
+{chr(10).join(f'   /{cmd}' for cmd, _ in self.state.generated_agent.commands)}
 
 ══════════════════════════════════════════════════════════════
 """
@@ -2,10 +2,14 @@
 Agent Builder - Generates specialized AI agents based on project profile and needs.
 """
 
+import hashlib
 import json
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Sequence
 
 try:
     from ..analyzers.doc_analyzer import ProjectProfile
@@ -17,7 +21,111 @@ except ImportError:
     from core.llm_abstraction import LLMProvider
 
 
-@dataclass
+# Strings that can be emitted as plain YAML scalars, minus the reserved words
+# YAML 1.1 would load as booleans or null
+_YAML_PLAIN = re.compile(r"[^\W\d][\w\-./()]*(?: [\w\-./()]+)*")
+_YAML_RESERVED = {"y", "yes", "n", "no", "true", "false", "on", "off", "null"}
+
+# Characters YAML won't read back verbatim (controls, BOM, line separators it
+# normalizes, lone surrogates): escaped in quoted scalars, never put in blocks
+_YAML_UNSAFE = re.compile(r"[\x7f-\x9f\ufeff\u2028\u2029\ud800-\udfff]")
+_YAML_BLOCK_UNSAFE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f-\x9f\ufeff\u2028\u2029\ud800-\udfff]")
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a scalar as YAML, double-quoting strings that need it."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return ".nan"
+        if value in (float("inf"), float("-inf")):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        return text if "." in text else text.replace("e", ".0e")
+    if isinstance(value, str):
+        if _YAML_PLAIN.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+            return value
+        quoted = json.dumps(value, ensure_ascii=False)
+        return _YAML_UNSAFE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+    raise TypeError(f"Unsupported YAML value: {type(value).__name__}")
+
+
+def _yaml_block(value: str, indent: int) -> list[str] | None:
+    """
+    Render a multi-line string as a literal block scalar: header, then lines.
+
+    Returns None when the string is single-line or can't round-trip as a
+    literal block (leading indentation, blank lines with spaces, control
+    characters); it is then double-quoted instead.
+    """
+    if "\n" not in value or _YAML_BLOCK_UNSAFE.search(value):
+        return None
+    text = value.rstrip("\n")
+    trailing = len(value) - len(text)
+    lines = text.split("\n")
+    first = next((line for line in lines if line), "")
+    if first[:1] in ("", " ", "\t") or any(line.isspace() for line in lines):
+        return None
+
+    header = "|-" if trailing == 0 else "|" if trailing == 1 else "|+"
+    lines.extend([""] * (trailing - 1))
+    pad = " " * indent
+    return [header] + [pad + line if line else "" for line in lines]
+
+
+def _yaml_lines(obj: Any, indent: int) -> list[str]:
+    """Render obj as block-style YAML lines at the given indent."""
+    pad = " " * indent
+    if isinstance(obj, dict) and obj:
+        lines = []
+        for key in sorted(obj):
+            value = obj[key]
+            if isinstance(value, dict) and value:
+                lines.append(f"{pad}{_yaml_scalar(key)}:")
+                lines.extend(_yaml_lines(value, indent + 2))
+            elif isinstance(value, list) and value:
+                lines.append(f"{pad}{_yaml_scalar(key)}:")
+                lines.extend(_yaml_lines(value, indent))
+            else:
+                value_lines = _yaml_lines(value, indent + 2)
+                value_lines[0] = f"{pad}{_yaml_scalar(key)}: {value_lines[0][indent + 2:]}"
+                lines.extend(value_lines)
+        return lines
+    if isinstance(obj, list) and obj:
+        lines = []
+        for item in obj:
+            item_lines = _yaml_lines(item, indent + 2)
+            item_lines[0] = f"{pad}- {item_lines[0][indent + 2:]}"
+            lines.extend(item_lines)
+        return lines
+    if isinstance(obj, dict):
+        return [pad + "{}"]
+    if isinstance(obj, list):
+        return [pad + "[]"]
+    if isinstance(obj, str):
+        block = _yaml_block(obj, indent or 2)
+        if block is not None:
+            return [pad + block[0]] + block[1:]
+    return [pad + _yaml_scalar(obj)]
+
+
+def _fast_yaml_dump(obj: Any) -> str:
+    """
+    Dump plain data (dict/list/str/int/float/bool/None) as block-style YAML.
+
+    Much cheaper than PyYAML's representer for the small rule dicts written by
+    GeneratedAgent.to_files. Keys are sorted like yaml.dump. Raises TypeError
+    for any other type.
+    """
+    return "\n".join(_yaml_lines(obj, 0)) + "\n"
+
+
+@dataclass(slots=True, frozen=True)
 class AgentCapability:
     """A capability/skill for an agent."""
     name: str
@@ -26,7 +134,7 @@ class AgentCapability:
     priority: int = 5  # 1-10, higher = more important
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentRecommendation:
     """A recommended agent type with justification."""
     agent_type: str
@@ -34,21 +142,21 @@ class AgentRecommendation:
     description: str
     priority: str  # "high", "medium", "low"
     justification: str
-    capabilities: list[AgentCapability] = field(default_factory=list)
+    capabilities: Sequence[AgentCapability] = field(default_factory=list)  # May be a shared tuple: do not mutate
     match_score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedAgent:
     """A fully generated agent ready for deployment."""
     name: str
     type: str
     system_prompt: str
     config: dict[str, Any]
-    commands: dict[str, str]  # command_name -> prompt
-    knowledge: dict[str, str]  # filename -> content
+    commands: tuple[tuple[str, str], ...]  # (command_name, prompt) pairs
+    knowledge: tuple[tuple[str, str], ...]  # (filename, content) pairs
     rules: dict[str, Any]
-    hooks: dict[str, str]  # hook_name -> script content
+    hooks: tuple[tuple[str, str], ...]  # (hook_name, script content) pairs
 
     def to_files(self, output_dir: Path) -> dict[str, Path]:
         """Export agent to file structure."""
@@ -62,16 +170,17 @@ class GeneratedAgent:
         agent_md.write_text(self.system_prompt)
         created_files["system_prompt"] = agent_md
 
-        # config.json
+        # config.json - streamed straight to the file
         config_file = agent_dir / "config.json"
-        config_file.write_text(json.dumps(self.config, indent=2))
+        with config_file.open("w", encoding="utf-8") as f:
+            json.dump(self.config, f, indent=2)
         created_files["config"] = config_file
 
         # Commands
         if self.commands:
             commands_dir = agent_dir / "commands"
             commands_dir.mkdir(exist_ok=True)
-            for cmd_name, cmd_content in self.commands.items():
+            for cmd_name, cmd_content in self.commands:
                 cmd_file = commands_dir / f"{cmd_name}.md"
                 cmd_file.write_text(cmd_content)
                 created_files[f"command_{cmd_name}"] = cmd_file
@@ -80,7 +189,7 @@ class GeneratedAgent:
         if self.knowledge:
             knowledge_dir = agent_dir / "knowledge"
             knowledge_dir.mkdir(exist_ok=True)
-            for filename, content in self.knowledge.items():
+            for filename, content in self.knowledge:
                 knowledge_file = knowledge_dir / filename
                 knowledge_file.write_text(content)
                 created_files[f"knowledge_{filename}"] = knowledge_file
@@ -92,8 +201,13 @@ class GeneratedAgent:
             for rule_name, rule_content in self.rules.items():
                 if isinstance(rule_content, dict):
                     rule_file = rules_dir / f"{rule_name}.yaml"
-                    import yaml
-                    rule_file.write_text(yaml.dump(rule_content, default_flow_style=False, allow_unicode=True))
+                    try:
+                        rule_yaml = _fast_yaml_dump(rule_content)
+                    except TypeError:
+                        # Dates and other non-plain values from loaded YAML
+                        import yaml
+                        rule_yaml = yaml.dump(rule_content, default_flow_style=False, allow_unicode=True)
+                    rule_file.write_text(rule_yaml)
                 else:
                     rule_file = rules_dir / f"{rule_name}.md"
                     rule_file.write_text(str(rule_content))
@@ -103,7 +217,7 @@ class GeneratedAgent:
         if self.hooks:
             hooks_dir = agent_dir / "hooks"
             hooks_dir.mkdir(exist_ok=True)
-            for hook_name, hook_content in self.hooks.items():
+            for hook_name, hook_content in self.hooks:
                 hook_file = hooks_dir / f"{hook_name}.sh"
                 hook_file.write_text(hook_content)
                 hook_file.chmod(0o755)
@@ -120,56 +234,56 @@ class AgentCatalog:
             "name": "Debug Helper",
             "description": "Aide au debugging et à la résolution d'incidents",
             "triggers": ["debugging", "incidents", "logs", "errors", "stack complexe"],
-            "capabilities": [
+            "capabilities": (
                 AgentCapability("log-analysis", "Analyse des logs d'erreur", "error logs", 9),
                 AgentCapability("stack-trace", "Interprétation des stack traces", "exception", 9),
                 AgentCapability("root-cause", "Identification de la cause racine", "bug", 8),
                 AgentCapability("fix-suggestion", "Suggestion de correctifs", "fix needed", 7),
-            ]
+            )
         },
         "code-reviewer": {
             "name": "Code Reviewer",
             "description": "Review de code et amélioration de la qualité",
             "triggers": ["code review", "qualité", "standards", "équipe junior"],
-            "capabilities": [
+            "capabilities": (
                 AgentCapability("style-check", "Vérification du style de code", "code style", 8),
                 AgentCapability("best-practices", "Suggestions de bonnes pratiques", "improvement", 8),
                 AgentCapability("security-scan", "Détection de problèmes de sécurité", "security", 9),
                 AgentCapability("performance", "Suggestions d'optimisation", "slow", 7),
-            ]
+            )
         },
         "test-generator": {
             "name": "Test Generator",
             "description": "Génération et amélioration des tests",
             "triggers": ["tests", "coverage", "TDD", "qualité"],
-            "capabilities": [
+            "capabilities": (
                 AgentCapability("unit-tests", "Génération de tests unitaires", "unit test", 9),
                 AgentCapability("integration-tests", "Tests d'intégration", "integration", 8),
                 AgentCapability("edge-cases", "Identification des cas limites", "edge case", 8),
                 AgentCapability("mocking", "Génération de mocks", "mock", 7),
-            ]
+            )
         },
         "onboarding-guide": {
             "name": "Onboarding Guide",
             "description": "Aide à la montée en compétence sur le projet",
             "triggers": ["legacy", "onboarding", "nouveau", "compréhension"],
-            "capabilities": [
+            "capabilities": (
                 AgentCapability("architecture-explain", "Explication de l'architecture", "architecture", 9),
                 AgentCapability("code-walkthrough", "Parcours du code", "understand", 8),
                 AgentCapability("conventions", "Explication des conventions", "convention", 7),
                 AgentCapability("history", "Contexte historique du projet", "why", 6),
-            ]
+            )
         },
         "security-checker": {
             "name": "Security Checker",
             "description": "Vérification de la sécurité du code",
             "triggers": ["sécurité", "données sensibles", "compliance", "RGPD", "PCI"],
-            "capabilities": [
+            "capabilities": (
                 AgentCapability("vulnerability-scan", "Détection de vulnérabilités", "security", 10),
                 AgentCapability("secrets-detection", "Détection de secrets exposés", "secret", 10),
                 AgentCapability("compliance-check", "Vérification de conformité", "compliance", 9),
                 AgentCapability("data-flow", "Analyse des flux de données", "data", 8),
-            ]
+            )
         },
     }
 
@@ -182,12 +296,234 @@ class AgentCatalog:
         return cls.AGENT_TYPES.get(agent_type)
 
 
+def _intern_catalog() -> None:
+    """Intern the catalog's name, description and trigger strings."""
+    for info in AgentCatalog.AGENT_TYPES.values():
+        info["name"] = sys.intern(info["name"])
+        info["description"] = sys.intern(info["description"])
+        info["triggers"] = [sys.intern(trigger) for trigger in info["triggers"]]
+
+
+_intern_catalog()
+
+# Lowercased triggers per agent type, computed once at import time
+_TRIGGERS_LOWER = {
+    agent_type: [sys.intern(trigger.lower()) for trigger in info["triggers"]]
+    for agent_type, info in AgentCatalog.AGENT_TYPES.items()
+}
+
+
+def _count_agent_hits(agent_type: str, text: str) -> int:
+    """Count the triggers of an agent type found in text."""
+    return sum(1 for trigger in _TRIGGERS_LOWER[agent_type] if trigger in text)
+
+
+# Catalogs with more agent types than this are scored with numpy, if installed
+_VECTORIZE_MIN_AGENTS = 8
+
+
+def _flatten_triggers() -> tuple[list[str], list[int]]:
+    """Flatten all triggers into one list, with the _TRIGGERS_LOWER index of each trigger's agent."""
+    triggers = []
+    agent_idx = []
+    for i, agent_triggers in enumerate(_TRIGGERS_LOWER.values()):
+        triggers.extend(agent_triggers)
+        agent_idx.extend([i] * len(agent_triggers))
+    return triggers, agent_idx
+
+
+@lru_cache(maxsize=1)
+def _trigger_matrix():
+    """
+    Build the numpy trigger array and trigger x agent membership matrix.
+
+    Returns None up to _VECTORIZE_MIN_AGENTS agent types or when numpy is not
+    installed; numpy is only imported once the threshold is met.
+    """
+    if len(_TRIGGERS_LOWER) <= _VECTORIZE_MIN_AGENTS:
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    triggers, agent_idx = _flatten_triggers()
+    membership = np.zeros((len(triggers), len(_TRIGGERS_LOWER)), dtype=np.int64)
+    membership[np.arange(len(triggers)), agent_idx] = 1
+    return np, np.array(triggers), membership
+
+# Total triggers from which the numba scanner is used (if installed), for texts
+# of at most _JIT_MAX_TEXT characters. Measured against the substring loop, the
+# scanner only wins with thousands of triggers and short texts.
+_JIT_MIN_TRIGGERS = 2000
+_JIT_MAX_TEXT = 500
+
+
+def _scan_triggers(text, trigger_offsets, trigger_lengths, trigger_data, agent_idx, counts):
+    """Count, per agent, the triggers occurring in text (code point arrays; compiled by numba)."""
+    n = text.shape[0]
+    for t in range(trigger_offsets.shape[0]):
+        start = trigger_offsets[t]
+        length = trigger_lengths[t]
+        for i in range(n - length + 1):
+            j = 0
+            while j < length and text[i + j] == trigger_data[start + j]:
+                j += 1
+            if j == length:
+                counts[agent_idx[t]] += 1
+                break
+    return counts
+
+
+@lru_cache(maxsize=1)
+def _trigger_scanner():
+    """
+    Compile the numba trigger scanner, returning a text -> counts per agent function.
+
+    Returns None below _JIT_MIN_TRIGGERS or when numba is not installed; numba
+    is only imported (and the scanner compiled) once the threshold is met.
+    """
+    total_triggers = sum(len(triggers) for triggers in _TRIGGERS_LOWER.values())
+    if total_triggers < _JIT_MIN_TRIGGERS:
+        return None
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    triggers, agent_idx = _flatten_triggers()
+    lengths = np.array([len(trigger) for trigger in triggers], dtype=np.int64)
+    offsets = np.zeros(len(triggers), dtype=np.int64)
+    offsets[1:] = np.cumsum(lengths)[:-1]
+    agent_idx = np.array(agent_idx, dtype=np.int64)
+    trigger_data = np.frombuffer("".join(triggers).encode("utf-32-le"), dtype=np.uint32)
+    kernel = numba.njit(cache=True)(_scan_triggers)
+
+    def scan(text: str) -> list[int]:
+        # Raises UnicodeEncodeError on lone surrogates
+        codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        counts = np.zeros(len(_TRIGGERS_LOWER), dtype=np.int64)
+        return kernel(codepoints, offsets, lengths, trigger_data, agent_idx, counts).tolist()
+
+    return scan
+
+
+def _count_text_hits(text: str) -> list[int]:
+    """Count the triggers found in text, per agent type (in _TRIGGERS_LOWER order)."""
+    if len(text) <= _JIT_MAX_TEXT:
+        scanner = _trigger_scanner()
+        if scanner is not None:
+            try:
+                return scanner(text)
+            except UnicodeEncodeError:
+                pass  # Not encodable (lone surrogates): use the paths below
+
+    matrix = _trigger_matrix()
+    if matrix is not None:
+        np, triggers, membership = matrix
+        hits = np.char.find(np.array([text]), triggers) >= 0
+        return (hits.astype(np.int64) @ membership).tolist()
+
+    return [_count_agent_hits(agent_type, text) for agent_type in _TRIGGERS_LOWER]
+
+
+def _count_trigger_hits(profile_text: str, assessment_text: str) -> dict[str, tuple[int, int]]:
+    """Count the triggers found in the profile and assessment text, per agent type."""
+    profile_counts = _count_text_hits(profile_text)
+    assessment_counts = _count_text_hits(assessment_text)
+    return {
+        agent_type: (profile_counts[i], assessment_counts[i])
+        for i, agent_type in enumerate(_TRIGGERS_LOWER)
+    }
+
+
+def _justify_debug(profile, pain_lower, prio_lower, exp_lower, sensitive_data, compliance) -> list[str]:
+    reasons = []
+    if profile.complexity == "high":
+        reasons.append("complexité élevée du projet")
+    if "debugging" in pain_lower:
+        reasons.append("debugging identifié comme difficulté principale")
+    return reasons
+
+
+def _justify_review(profile, pain_lower, prio_lower, exp_lower, sensitive_data, compliance) -> list[str]:
+    reasons = []
+    if "junior" in exp_lower or "mixte" in exp_lower:
+        reasons.append("équipe avec profils mixtes")
+    if "qualité" in prio_lower:
+        reasons.append("qualité du code prioritaire")
+    return reasons
+
+
+def _justify_tests(profile, pain_lower, prio_lower, exp_lower, sensitive_data, compliance) -> list[str]:
+    if "test" in pain_lower:
+        return ["tests identifiés comme point de friction"]
+    return []
+
+
+def _justify_onboarding(profile, pain_lower, prio_lower, exp_lower, sensitive_data, compliance) -> list[str]:
+    if profile.complexity in ["high", "medium"]:
+        return ["projet complexe nécessitant une montée en compétence"]
+    return []
+
+
+def _justify_security(profile, pain_lower, prio_lower, exp_lower, sensitive_data, compliance) -> list[str]:
+    reasons = []
+    if sensitive_data:
+        reasons.append("données sensibles à protéger")
+    if compliance:
+        reasons.append(f"compliance requise: {', '.join(compliance)}")
+    return reasons
+
+
+_JUSTIFICATION_HANDLERS = {
+    "debug-helper": _justify_debug,
+    "code-reviewer": _justify_review,
+    "test-generator": _justify_tests,
+    "onboarding-guide": _justify_onboarding,
+    "security-checker": _justify_security,
+}
+
+
+class RecommendationCache:
+    """
+    Bounded FIFO cache of ranked recommendations, keyed on their inputs.
+
+    Keys are SHA-256 digests of the inputs' repr, so an entry never keeps a
+    copy of a (possibly large) document alive.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: dict[bytes, list[AgentRecommendation]] = {}
+
+    def get_or_compute(
+        self,
+        inputs: tuple,
+        compute: Callable[[], list[AgentRecommendation]]
+    ) -> list[AgentRecommendation]:
+        """Return the cached list for inputs, calling compute() on a miss."""
+        key = hashlib.sha256(repr(inputs).encode()).digest()
+        recommendations = self._entries.get(key)
+        if recommendations is None:
+            recommendations = compute()
+            if len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = recommendations
+        return recommendations
+
+
 class AgentRecommender:
     """Recommends appropriate agents based on project profile and needs."""
 
+    # Max (profile, assessment) pairs kept in the recommendation cache
+    CACHE_SIZE = 128
+
     def __init__(self, llm: LLMProvider | None = None):
         self.llm = llm
         self.catalog = AgentCatalog()
+        self._cache = RecommendationCache(self.CACHE_SIZE)
 
     def recommend(
         self,
@@ -196,14 +532,62 @@ class AgentRecommender:
         max_recommendations: int = 3
     ) -> list[AgentRecommendation]:
         """Generate agent recommendations."""
+        ranked = self._cache.get_or_compute(
+            self._ranking_key(profile, assessment),
+            lambda: self._rank_agents(profile, assessment)
+        )
+        return ranked[:max_recommendations]
+
+    @staticmethod
+    def _ranking_key(profile: ProjectProfile, assessment: NeedsAssessment) -> tuple:
+        """Cache key made of the fields _rank_agents reads (not raw_content and the like)."""
+        return (
+            tuple(profile.stack),
+            tuple(profile.patterns),
+            tuple(profile.pain_points),
+            profile.complexity,
+            tuple(profile.features),
+            tuple(assessment.main_pain_points),
+            tuple(assessment.priorities),
+            assessment.additional_context,
+            assessment.experience_level,
+            assessment.sensitive_data,
+            tuple(assessment.compliance_requirements),
+        )
+
+    def _rank_agents(
+        self,
+        profile: ProjectProfile,
+        assessment: NeedsAssessment
+    ) -> list[AgentRecommendation]:
+        """Score every agent type and return matches sorted by score."""
         recommendations = []
 
+        # Profile and assessment text shared by every agent type
+        profile_text = " ".join([
+            " ".join(profile.stack),
+            " ".join(profile.patterns),
+            " ".join(profile.pain_points),
+            profile.complexity,
+            " ".join(profile.features)
+        ]).lower()
+        pain_lower = " ".join(assessment.main_pain_points).lower()
+        prio_lower = " ".join(assessment.priorities).lower()
+        exp_lower = assessment.experience_level.lower()
+        assessment_text = " ".join([pain_lower, prio_lower, assessment.additional_context.lower()])
+
+        trigger_hits = _count_trigger_hits(profile_text, assessment_text)
+
         for agent_type, info in AgentCatalog.AGENT_TYPES.items():
-            score = self._calculate_match_score(agent_type, info, profile, assessment)
+            score = self._calculate_match_score(
+                agent_type, info, profile, assessment, trigger_hits[agent_type], assessment_text, exp_lower
+            )
 
             if score > 0:
                 priority = "high" if score > 0.7 else "medium" if score > 0.4 else "low"
-                justification = self._generate_justification(agent_type, info, profile, assessment, score)
+                justification = self._generate_justification(
+                    agent_type, info, profile, assessment, score, pain_lower, prio_lower, exp_lower
+                )
 
                 recommendations.append(AgentRecommendation(
                     agent_type=agent_type,
@@ -211,48 +595,34 @@ class AgentRecommender:
                     description=info["description"],
                     priority=priority,
                     justification=justification,
-                    capabilities=[AgentCapability(**cap.__dict__) for cap in info["capabilities"]],
+                    capabilities=info["capabilities"],
                     match_score=score
                 ))
 
-        # Sort by score and return top N
+        # Sort by score
         recommendations.sort(key=lambda x: x.match_score, reverse=True)
-        return recommendations[:max_recommendations]
+        return recommendations
 
     def _calculate_match_score(
         self,
         agent_type: str,
         info: dict,
         profile: ProjectProfile,
-        assessment: NeedsAssessment
+        assessment: NeedsAssessment,
+        trigger_hits: tuple[int, int],
+        assessment_text: str,
+        exp_lower: str
     ) -> float:
         """Calculate how well an agent type matches the context."""
         score = 0.0
-        triggers = info["triggers"]
-
-        # Check profile matches
-        profile_text = " ".join([
-            " ".join(profile.stack),
-            " ".join(profile.patterns),
-            " ".join(profile.pain_points),
-            profile.complexity,
-            " ".join(profile.features)
-        ]).lower()
-
-        for trigger in triggers:
-            if trigger.lower() in profile_text:
-                score += 0.2
-
-        # Check assessment matches
-        assessment_text = " ".join([
-            " ".join(assessment.main_pain_points),
-            " ".join(assessment.priorities),
-            assessment.additional_context
-        ]).lower()
+        profile_hits, assessment_hits = trigger_hits
 
-        for trigger in triggers:
-            if trigger.lower() in assessment_text:
-                score += 0.3
+        # Profile and assessment matches (summed one by one, as rounding
+        # near the priority thresholds depends on it)
+        for _ in range(profile_hits):
+            score += 0.2
+        for _ in range(assessment_hits):
+            score += 0.3
 
         # Specific adjustments
         if agent_type == "debug-helper" and profile.complexity == "high":
@@ -261,7 +631,7 @@ class AgentRecommender:
         if agent_type == "security-checker" and assessment.sensitive_data:
             score += 0.4
 
-        if agent_type == "onboarding-guide" and "mixte" in assessment.experience_level.lower():
+        if agent_type == "onboarding-guide" and "mixte" in exp_lower:
             score += 0.2
 
         if agent_type == "test-generator" and "test" in assessment_text:
@@ -275,36 +645,17 @@ class AgentRecommender:
         info: dict,
         profile: ProjectProfile,
         assessment: NeedsAssessment,
-        score: float
+        score: float,
+        pain_lower: str,
+        prio_lower: str,
+        exp_lower: str
     ) -> str:
         """Generate human-readable justification for recommendation."""
-        reasons = []
-
-        if agent_type == "debug-helper":
-            if profile.complexity == "high":
-                reasons.append("complexité élevée du projet")
-            if "debugging" in " ".join(assessment.main_pain_points).lower():
-                reasons.append("debugging identifié comme difficulté principale")
-
-        elif agent_type == "code-reviewer":
-            if "junior" in assessment.experience_level.lower() or "mixte" in assessment.experience_level.lower():
-                reasons.append("équipe avec profils mixtes")
-            if "qualité" in " ".join(assessment.priorities).lower():
-                reasons.append("qualité du code prioritaire")
-
-        elif agent_type == "test-generator":
-            if "test" in " ".join(assessment.main_pain_points).lower():
-                reasons.append("tests identifiés comme point de friction")
-
-        elif agent_type == "onboarding-guide":
-            if profile.complexity in ["high", "medium"]:
-                reasons.append("projet complexe nécessitant une montée en compétence")
-
-        elif agent_type == "security-checker":
-            if assessment.sensitive_data:
-                reasons.append("données sensibles à protéger")
-            if assessment.compliance_requirements:
-                reasons.append(f"compliance requise: {', '.join(assessment.compliance_requirements)}")
+        handler = _JUSTIFICATION_HANDLERS.get(agent_type)
+        reasons = handler(
+            profile, pain_lower, prio_lower, exp_lower,
+            assessment.sensitive_data, assessment.compliance_requirements
+        ) if handler else []
 
         if not reasons:
             reasons.append(f"score de correspondance: {score:.0%}")
@@ -313,26 +664,171 @@ class AgentRecommender:
 
     def format_recommendations(self, recommendations: list[AgentRecommendation]) -> str:
         """Format recommendations for display."""
-        output = """
+        parts = ["""
 ╔══════════════════════════════════════════════════════════════╗
 ║              AGENTS IA RECOMMANDÉS                           ║
 ╚══════════════════════════════════════════════════════════════╝
-"""
+"""]
         for i, rec in enumerate(recommendations, 1):
             priority_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}[rec.priority]
-            output += f"""
+            parts.append(f"""
 {i}. {rec.name} {priority_icon} [{rec.priority.upper()}]
    {rec.description}
 
    📋 Justification: {rec.justification}
 
    🛠️  Capacités:
+""")
+            parts.extend(f"      • {cap.name}: {cap.description}\n" for cap in rec.capabilities[:3])
+
+        parts.append("\n" + "="*60)
+        return "".join(parts)
+
+
+# Constant prompt blocks and hook scripts shared by every generated agent
+_RULES_BOILERPLATE = """
+## Règles de Conduite
+1. Sois concis et actionnable dans tes réponses
+2. Adapte ton niveau de détail à l'expérience de l'équipe
+3. Propose toujours des solutions concrètes
+4. Respecte les conventions du projet
+5. Signale tout problème de sécurité potentiel
+"""
+
+_SENSITIVE_BLOCK = """
+## ⚠️ DONNÉES SENSIBLES
+Ce projet traite des données sensibles. Tu dois :
+- Ne JAMAIS inclure de vraies données dans tes exemples
+- Toujours utiliser des données fictives
+- Alerter si tu détectes des données sensibles exposées
+"""
+
+_COMPLIANCE_TEMPLATE = """
+## Compliance
+Exigences: {requirements}
+Assure-toi que tes suggestions respectent ces normes.
+"""
+
+_COMMAND_DEBUG = """# /debug - Analyser un problème
+
+Analyse le problème décrit et propose des pistes de résolution.
+
+## Usage
+/debug <description du problème>
+
+## Ce que je fais
+1. J'analyse les symptômes décrits
+2. Je cherche les causes possibles dans le contexte du projet
+3. Je propose des étapes de diagnostic
+4. Je suggère des solutions
+
+Décris ton problème et je t'aide à le résoudre.
+"""
+
+_COMMAND_TRACE = """# /trace - Analyser une stack trace
+
+Analyse une stack trace ou des logs d'erreur.
+
+## Usage
+/trace
+Puis colle ta stack trace.
+
+## Ce que je fais
+1. J'identifie l'erreur principale
+2. Je localise la source dans le code
+3. J'explique la cause probable
+4. Je propose un correctif
+"""
+
+_COMMAND_REVIEW = """# /review - Review de code
+
+Effectue une review du code fourni.
+
+## Usage
+/review
+Puis colle le code à reviewer.
+
+## Ce que je vérifie
+- Style et conventions
+- Bonnes pratiques
+- Problèmes de sécurité potentiels
+- Opportunités d'amélioration
+"""
+
+_COMMAND_TEST = """# /test - Générer des tests
+
+Génère des tests pour le code fourni.
+
+## Usage
+/test
+Puis colle le code à tester.
+
+## Ce que je génère
+- Tests unitaires
+- Cas limites
+- Mocks nécessaires
+"""
+
+_COMMAND_SECURITY = """# /security - Audit de sécurité
+
+Effectue un audit de sécurité du code.
+
+## Usage
+/security
+Puis colle le code à auditer.
+
+## Ce que je vérifie
+- Vulnérabilités OWASP Top 10
+- Secrets exposés
+- Injection possibles
+- Problèmes d'authentification/autorisation
 """
-            for cap in rec.capabilities[:3]:
-                output += f"      • {cap.name}: {cap.description}\n"
 
-        output += "\n" + "="*60
-        return output
+_COMMAND_TEMPLATES = {
+    "debug-helper": (
+        ("debug", _COMMAND_DEBUG),
+        ("trace", _COMMAND_TRACE),
+    ),
+    "code-reviewer": (
+        ("review", _COMMAND_REVIEW),
+    ),
+    "test-generator": (
+        ("test", _COMMAND_TEST),
+    ),
+    "security-checker": (
+        ("security", _COMMAND_SECURITY),
+    ),
+}
+
+_HOOK_CONVERSATION_START = """#!/bin/bash
+# Hook: on-conversation-start
+# Called when a new conversation begins
+
+# Log session start (placeholder for metrics)
+echo "[$(date -Iseconds)] SESSION_START user=$USER agent=$AGENT_TYPE" >> /tmp/assistant-architect-metrics.log
+"""
+
+_HOOK_TASK_COMPLETE = """#!/bin/bash
+# Hook: on-task-complete
+# Called when a task is completed
+
+# Log task completion (placeholder for metrics)
+echo "[$(date -Iseconds)] TASK_COMPLETE task=$TASK_NAME duration=$DURATION" >> /tmp/assistant-architect-metrics.log
+"""
+
+_HOOK_CODE_GENERATED = """#!/bin/bash
+# Hook: on-code-generated
+# Called when code is generated
+
+# Log code generation (placeholder for metrics)
+echo "[$(date -Iseconds)] CODE_GENERATED file=$FILE_PATH lines=$LINE_COUNT language=$LANGUAGE" >> /tmp/assistant-architect-metrics.log
+"""
+
+_HOOKS = (
+    ("on-conversation-start", _HOOK_CONVERSATION_START),
+    ("on-task-complete", _HOOK_TASK_COMPLETE),
+    ("on-code-generated", _HOOK_CODE_GENERATED),
+)
 
 
 class AgentBuilder:
@@ -389,7 +885,7 @@ class AgentBuilder:
         """Generate the agent's system prompt."""
 
         # Base personality
-        base_prompt = f"""# {recommendation.name}
+        parts: list[str] = [f"""# {recommendation.name}
 
 ## Rôle
 Tu es un assistant IA spécialisé : **{recommendation.description}**.
@@ -406,36 +902,20 @@ Tu travailles sur le projet "{profile.name or 'ce projet'}" avec une équipe de
 - **Priorités**: {', '.join(assessment.priorities) or 'Non spécifié'}
 
 ## Tes Capacités
-"""
-        for cap in recommendation.capabilities:
-            base_prompt += f"- **{cap.name}**: {cap.description}\n"
+"""]
+        parts.extend(f"- **{cap.name}**: {cap.description}\n" for cap in recommendation.capabilities)
 
-        base_prompt += """
-## Règles de Conduite
-1. Sois concis et actionnable dans tes réponses
-2. Adapte ton niveau de détail à l'expérience de l'équipe
-3. Propose toujours des solutions concrètes
-4. Respecte les conventions du projet
-5. Signale tout problème de sécurité potentiel
-"""
+        parts.append(_RULES_BOILERPLATE)
 
         if assessment.sensitive_data:
-            base_prompt += """
-## ⚠️ DONNÉES SENSIBLES
-Ce projet traite des données sensibles. Tu dois :
-- Ne JAMAIS inclure de vraies données dans tes exemples
-- Toujours utiliser des données fictives
-- Alerter si tu détectes des données sensibles exposées
-"""
+            parts.append(_SENSITIVE_BLOCK)
 
         if assessment.compliance_requirements:
-            base_prompt += f"""
-## Compliance
-Exigences: {', '.join(assessment.compliance_requirements)}
-Assure-toi que tes suggestions respectent ces normes.
-"""
+            parts.append(_COMPLIANCE_TEMPLATE.format(
+                requirements=', '.join(assessment.compliance_requirements)
+            ))
 
-        return base_prompt
+        return "".join(parts)
 
     def _generate_config(self, recommendation: AgentRecommendation, profile: ProjectProfile) -> dict:
         """Generate agent configuration."""
@@ -456,97 +936,19 @@ Assure-toi que tes suggestions respectent ces normes.
             }
         }
 
-    def _generate_commands(self, recommendation: AgentRecommendation, profile: ProjectProfile) -> dict[str, str]:
+    def _generate_commands(
+        self, recommendation: AgentRecommendation, profile: ProjectProfile
+    ) -> tuple[tuple[str, str], ...]:
         """Generate slash commands for the agent."""
-        commands = {}
-
-        if recommendation.agent_type == "debug-helper":
-            commands["debug"] = """# /debug - Analyser un problème
-
-Analyse le problème décrit et propose des pistes de résolution.
-
-## Usage
-/debug <description du problème>
+        return _COMMAND_TEMPLATES.get(recommendation.agent_type, ())
 
-## Ce que je fais
-1. J'analyse les symptômes décrits
-2. Je cherche les causes possibles dans le contexte du projet
-3. Je propose des étapes de diagnostic
-4. Je suggère des solutions
-
-Décris ton problème et je t'aide à le résoudre.
-"""
-            commands["trace"] = """# /trace - Analyser une stack trace
-
-Analyse une stack trace ou des logs d'erreur.
-
-## Usage
-/trace
-Puis colle ta stack trace.
-
-## Ce que je fais
-1. J'identifie l'erreur principale
-2. Je localise la source dans le code
-3. J'explique la cause probable
-4. Je propose un correctif
-"""
-
-        elif recommendation.agent_type == "code-reviewer":
-            commands["review"] = """# /review - Review de code
-
-Effectue une review du code fourni.
-
-## Usage
-/review
-Puis colle le code à reviewer.
-
-## Ce que je vérifie
-- Style et conventions
-- Bonnes pratiques
-- Problèmes de sécurité potentiels
-- Opportunités d'amélioration
-"""
-
-        elif recommendation.agent_type == "test-generator":
-            commands["test"] = """# /test - Générer des tests
-
-Génère des tests pour le code fourni.
-
-## Usage
-/test
-Puis colle le code à tester.
-
-## Ce que je génère
-- Tests unitaires
-- Cas limites
-- Mocks nécessaires
-"""
-
-        elif recommendation.agent_type == "security-checker":
-            commands["security"] = """# /security - Audit de sécurité
-
-Effectue un audit de sécurité du code.
-
-## Usage
-/security
-Puis colle le code à auditer.
-
-## Ce que je vérifie
-- Vulnérabilités OWASP Top 10
-- Secrets exposés
-- Injection possibles
-- Problèmes d'authentification/autorisation
-"""
-
-        return commands
-
-    def _generate_knowledge(self, profile: ProjectProfile) -> dict[str, str]:
+    def _generate_knowledge(self, profile: ProjectProfile) -> tuple[tuple[str, str], ...]:
         """Generate knowledge base files."""
-        knowledge = {}
+        knowledge = []
 
         # Architecture summary
         if profile.description or profile.patterns:
-            knowledge["architecture.md"] = f"""# Architecture du Projet
+            knowledge.append(("architecture.md", f"""# Architecture du Projet
 
 ## Description
 {profile.description or 'Projet de développement'}
@@ -559,16 +961,16 @@ Puis colle le code à auditer.
 
 ## Complexité
 {profile.complexity}
-"""
+"""))
 
         # Conventions (if detected)
         if profile.conventions:
-            knowledge["conventions.md"] = f"""# Conventions du Projet
+            knowledge.append(("conventions.md", f"""# Conventions du Projet
 
 {json.dumps(profile.conventions, indent=2)}
-"""
+"""))
 
-        return knowledge
+        return tuple(knowledge)
 
     def _apply_enterprise_rules(self, enterprise_rules: dict | None) -> dict[str, Any]:
         """Apply enterprise rules to the agent."""
@@ -591,28 +993,6 @@ Puis colle le code à auditer.
 
         return rules
 
-    def _generate_hooks(self) -> dict[str, str]:
+    def _generate_hooks(self) -> tuple[tuple[str, str], ...]:
         """Generate hook scripts for metrics collection."""
-        return {
-            "on-conversation-start": """#!/bin/bash
-# Hook: on-conversation-start
-# Called when a new conversation begins
-
-# Log session start (placeholder for metrics)
-echo "[$(date -Iseconds)] SESSION_START user=$USER agent=$AGENT_TYPE" >> /tmp/assistant-architect-metrics.log
-""",
-            "on-task-complete": """#!/bin/bash
-# Hook: on-task-complete
-# Called when a task is completed
-
-# Log task completion (placeholder for metrics)
-echo "[$(date -Iseconds)] TASK_COMPLETE task=$TASK_NAME duration=$DURATION" >> /tmp/assistant-architect-metrics.log
-""",
-            "on-code-generated": """#!/bin/bash
-# Hook: on-code-generated
-# Called when code is generated
-
-# Log code generation (placeholder for metrics)
-echo "[$(date -Iseconds)] CODE_GENERATED file=$FILE_PATH lines=$LINE_COUNT language=$LANGUAGE" >> /tmp/assistant-architect-metrics.log
-"""
-        }
+        return _HOOKS
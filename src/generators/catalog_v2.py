@@ -8,8 +8,16 @@ This catalog provides dynamic agent recommendations based on:
 Key principle: Recommendations are DYNAMIC, not hardcoded. The content adapts to each project.
 """
 
+import fnmatch
+import re
+import threading
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from enum import IntEnum
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Iterable
 
 import sys
 from pathlib import Path
@@ -22,345 +30,368 @@ if _src_path not in sys.path:
 try:
     from analyzers.doc_analyzer import ProjectProfile
     from dialogue.needs_assessor import NeedsAssessment
-    from generators.agent_builder import AgentCapability, AgentRecommendation
+    from generators.agent_builder import AgentCapability, AgentRecommendation, RecommendationCache
 except ImportError:
     from ..analyzers.doc_analyzer import ProjectProfile
     from ..dialogue.needs_assessor import NeedsAssessment
-    from .agent_builder import AgentCapability, AgentRecommendation
+    from .agent_builder import AgentCapability, AgentRecommendation, RecommendationCache
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: falls back to per-keyword substring checks
+    ahocorasick = None
+
+try:
+    import marisa_trie
+except ImportError:  # Optional: falls back to a dict-based trie
+    marisa_trie = None
 
 
 # =============================================================================
 # SPECIALIZATION DEFINITIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TechSpecialization:
-    """A technology specialization within an expert domain."""
+    """
+    A technology specialization within an expert domain.
+
+    Keywords must be declared lowercase: matchers lowercase the scanned text
+    once and compare keywords as-is. Once built, keywords is a frozenset and
+    keyword_order keeps the declared order.
+    """
     name: str
-    keywords: list[str]  # Detection keywords
-    capabilities: list[str]  # Specific capabilities for this tech
-    commands: list[str]  # Suggested slash commands
-
-
-# Frontend specializations
-FRONTEND_SPECIALIZATIONS = {
-    "react": TechSpecialization(
-        name="React",
-        keywords=["react", "jsx", "tsx", "next.js", "nextjs", "redux", "zustand", "react-query"],
-        capabilities=["Hooks patterns", "State management (Redux/Zustand)", "React Testing Library", "Performance optimization (memo, lazy)"],
-        commands=["/component", "/hook", "/test-rtl"]
-    ),
-    "vue": TechSpecialization(
-        name="Vue.js",
-        keywords=["vue", "vuex", "pinia", "nuxt", "vite"],
-        capabilities=["Composition API", "Pinia/Vuex patterns", "Vue Test Utils", "Nuxt conventions"],
-        commands=["/component", "/composable", "/test-vue"]
-    ),
-    "angular": TechSpecialization(
-        name="Angular",
-        keywords=["angular", "@angular", "ngrx", "rxjs"],
-        capabilities=["RxJS patterns", "NgModules vs Standalone", "Angular Testing", "Signals"],
-        commands=["/component", "/service", "/test-angular"]
-    ),
-    "svelte": TechSpecialization(
-        name="Svelte",
-        keywords=["svelte", "sveltekit"],
-        capabilities=["Svelte stores", "SvelteKit routing", "Svelte testing"],
-        commands=["/component", "/store"]
-    ),
-    "typescript": TechSpecialization(
-        name="TypeScript",
-        keywords=["typescript", ".ts", "tsconfig"],
-        capabilities=["Type definitions", "Generics", "Utility types", "Type guards"],
-        commands=["/types", "/interface"]
-    ),
+    keywords: Iterable[str]  # Detection keywords, declared in order; stored as a frozenset
+    capabilities: tuple[str, ...]  # Specific capabilities for this tech
+    commands: tuple[str, ...]  # Suggested slash commands
+    keyword_order: tuple[str, ...] = field(init=False)  # Keywords in declaration order
+
+    def __post_init__(self):
+        assert all(k == k.lower() for k in self.keywords), f"{self.name}: keywords must be lowercase"
+        keyword_order = tuple(sys.intern(k) for k in self.keywords)
+        object.__setattr__(self, "keyword_order", keyword_order)
+        object.__setattr__(self, "keywords", frozenset(keyword_order))
+
+    def keyword_matches(self, tokens) -> frozenset[str]:
+        """Return the keywords of this specialization present in a set of tokens."""
+        return self.keywords.intersection(tokens)
+
+
+# One row per specialization:
+# (expert_id, tech_id, name, keywords, capabilities, commands)
+_TECH_ROWS: tuple[tuple[str, str, str, tuple[str, ...], tuple[str, ...], tuple[str, ...]], ...] = (
+    # Frontend
+    ("frontend-expert", "react", "React",
+     ("react", "jsx", "tsx", "next.js", "nextjs", "redux", "zustand", "react-query"),
+     ("Hooks patterns", "State management (Redux/Zustand)", "React Testing Library", "Performance optimization (memo, lazy)"),
+     ("/component", "/hook", "/test-rtl")),
+    ("frontend-expert", "vue", "Vue.js",
+     ("vue", "vuex", "pinia", "nuxt", "vite"),
+     ("Composition API", "Pinia/Vuex patterns", "Vue Test Utils", "Nuxt conventions"),
+     ("/component", "/composable", "/test-vue")),
+    ("frontend-expert", "angular", "Angular",
+     ("angular", "@angular", "ngrx", "rxjs"),
+     ("RxJS patterns", "NgModules vs Standalone", "Angular Testing", "Signals"),
+     ("/component", "/service", "/test-angular")),
+    ("frontend-expert", "svelte", "Svelte",
+     ("svelte", "sveltekit"),
+     ("Svelte stores", "SvelteKit routing", "Svelte testing"),
+     ("/component", "/store")),
+    ("frontend-expert", "typescript", "TypeScript",
+     ("typescript", ".ts", "tsconfig"),
+     ("Type definitions", "Generics", "Utility types", "Type guards"),
+     ("/types", "/interface")),
+
+    # Backend
+    ("backend-expert", "spring", "Spring Boot",
+     ("spring", "spring-boot", "springboot", "pom.xml", "gradle", "java", ".java"),
+     ("Spring MVC/WebFlux", "JPA/Hibernate", "Spring Security", "Testing (JUnit/Mockito)"),
+     ("/controller", "/service", "/repository", "/test-spring")),
+    ("backend-expert", "django", "Django",
+     ("django", "djangorestframework", "drf"),
+     ("Django ORM", "DRF serializers", "Django testing", "Celery tasks"),
+     ("/view", "/model", "/serializer", "/test-django")),
+    ("backend-expert", "fastapi", "FastAPI",
+     ("fastapi", "uvicorn", "starlette"),
+     ("Pydantic models", "Dependency injection", "Async patterns", "OpenAPI"),
+     ("/endpoint", "/schema", "/test-fastapi")),
+    ("backend-expert", "nodejs", "Node.js",
+     ("express", "nestjs", "koa", "node", "npm", "package.json"),
+     ("Express/NestJS patterns", "Middleware", "Async/await", "Jest testing"),
+     ("/route", "/middleware", "/test-node")),
+    ("backend-expert", "go", "Go",
+     ("golang", "go.mod", "go.sum", ".go"),
+     ("Go idioms", "Goroutines/channels", "Go testing", "Error handling"),
+     ("/handler", "/test-go")),
+    ("backend-expert", "rust", "Rust",
+     ("rust", "cargo.toml", ".rs"),
+     ("Ownership/borrowing", "Error handling (Result)", "Async Rust", "Testing"),
+     ("/impl", "/test-rust")),
+
+    # Data
+    ("data-expert", "postgresql", "PostgreSQL",
+     ("postgres", "postgresql", "psql", "pg_"),
+     ("Query optimization", "Indexing strategies", "Stored procedures", "JSONB"),
+     ("/query", "/index", "/explain")),
+    ("data-expert", "mongodb", "MongoDB",
+     ("mongodb", "mongoose", "mongo"),
+     ("Aggregation pipelines", "Schema design", "Indexing", "Transactions"),
+     ("/aggregate", "/schema", "/index")),
+    ("data-expert", "redis", "Redis",
+     ("redis", "ioredis", "redis-py"),
+     ("Caching patterns", "Pub/Sub", "Data structures", "Lua scripts"),
+     ("/cache", "/pubsub")),
+    ("data-expert", "elasticsearch", "Elasticsearch",
+     ("elasticsearch", "elastic", "opensearch"),
+     ("Query DSL", "Mappings", "Aggregations", "Performance tuning"),
+     ("/search", "/mapping")),
+    ("data-expert", "sql", "SQL",
+     ("sql", "mysql", "mariadb", "sqlite", ".sql"),
+     ("Query optimization", "Joins", "Indexing", "Transactions"),
+     ("/query", "/optimize")),
+
+    # DevOps
+    ("devops-expert", "docker", "Docker",
+     ("docker", "dockerfile", "docker-compose", "containerfile"),
+     ("Multi-stage builds", "Compose orchestration", "Security best practices", "Optimization"),
+     ("/dockerfile", "/compose")),
+    ("devops-expert", "kubernetes", "Kubernetes",
+     ("kubernetes", "k8s", "kubectl", "helm", "kustomize"),
+     ("Deployment strategies", "Services/Ingress", "ConfigMaps/Secrets", "Helm charts"),
+     ("/manifest", "/helm", "/debug-k8s")),
+    ("devops-expert", "terraform", "Terraform",
+     ("terraform", ".tf", "tfstate", "hcl"),
+     ("Module design", "State management", "Provider patterns", "Best practices"),
+     ("/resource", "/module")),
+    ("devops-expert", "cicd", "CI/CD",
+     ("github-actions", ".github/workflows", "gitlab-ci", "jenkins", "circleci"),
+     ("Pipeline design", "Testing stages", "Deployment automation", "Security scanning"),
+     ("/pipeline", "/workflow")),
+    ("devops-expert", "ansible", "Ansible",
+     ("ansible", "playbook", ".yml", "inventory"),
+     ("Playbook design", "Roles", "Inventory management", "Vault"),
+     ("/playbook", "/role")),
+
+    # Mobile
+    ("mobile-expert", "ios", "iOS/Swift",
+     ("swift", "xcode", "cocoapods", "spm", ".swift", "xcodeproj"),
+     ("SwiftUI/UIKit", "Combine", "Core Data", "XCTest"),
+     ("/view", "/viewmodel", "/test-ios")),
+    ("mobile-expert", "android", "Android/Kotlin",
+     ("kotlin", "android", "gradle", ".kt", "jetpack"),
+     ("Jetpack Compose", "Coroutines/Flow", "Room", "Android testing"),
+     ("/composable", "/viewmodel", "/test-android")),
+    ("mobile-expert", "flutter", "Flutter",
+     ("flutter", "dart", "pubspec.yaml", ".dart"),
+     ("Widget patterns", "State management (Bloc/Riverpod)", "Platform channels", "Testing"),
+     ("/widget", "/bloc", "/test-flutter")),
+    ("mobile-expert", "reactnative", "React Native",
+     ("react-native", "expo", "metro"),
+     ("Native modules", "Navigation", "State management", "Testing"),
+     ("/screen", "/hook", "/test-rn")),
+
+    # Cloud
+    ("cloud-expert", "aws", "AWS",
+     ("aws", "lambda", "s3", "dynamodb", "cloudformation", "cdk", "sam"),
+     ("Lambda patterns", "API Gateway", "DynamoDB design", "CloudFormation/CDK"),
+     ("/lambda", "/cloudformation")),
+    ("cloud-expert", "gcp", "Google Cloud",
+     ("gcp", "google-cloud", "cloud-functions", "firestore", "bigquery"),
+     ("Cloud Functions", "Firestore", "BigQuery", "Pub/Sub"),
+     ("/function", "/firestore")),
+    ("cloud-expert", "azure", "Azure",
+     ("azure", "azure-functions", "cosmosdb", "arm-template"),
+     ("Azure Functions", "CosmosDB", "ARM templates", "Azure DevOps"),
+     ("/function", "/arm")),
+    ("cloud-expert", "serverless", "Serverless",
+     ("serverless", "serverless.yml", "netlify", "vercel"),
+     ("Serverless patterns", "Cold start optimization", "Event-driven design"),
+     ("/function", "/serverless")),
+)
+
+# All specializations, keyed by (expert_id, tech_id) in declaration order
+SPECIALIZATIONS: dict[tuple[str, str], TechSpecialization] = {
+    (expert_id, tech_id): TechSpecialization(name, keywords, capabilities, commands)
+    for expert_id, tech_id, name, keywords, capabilities, commands in _TECH_ROWS
 }
 
-# Backend specializations
-BACKEND_SPECIALIZATIONS = {
-    "spring": TechSpecialization(
-        name="Spring Boot",
-        keywords=["spring", "spring-boot", "springboot", "pom.xml", "gradle", "java", ".java"],
-        capabilities=["Spring MVC/WebFlux", "JPA/Hibernate", "Spring Security", "Testing (JUnit/Mockito)"],
-        commands=["/controller", "/service", "/repository", "/test-spring"]
-    ),
-    "django": TechSpecialization(
-        name="Django",
-        keywords=["django", "djangorestframework", "drf"],
-        capabilities=["Django ORM", "DRF serializers", "Django testing", "Celery tasks"],
-        commands=["/view", "/model", "/serializer", "/test-django"]
-    ),
-    "fastapi": TechSpecialization(
-        name="FastAPI",
-        keywords=["fastapi", "uvicorn", "starlette"],
-        capabilities=["Pydantic models", "Dependency injection", "Async patterns", "OpenAPI"],
-        commands=["/endpoint", "/schema", "/test-fastapi"]
-    ),
-    "nodejs": TechSpecialization(
-        name="Node.js",
-        keywords=["express", "nestjs", "koa", "node", "npm", "package.json"],
-        capabilities=["Express/NestJS patterns", "Middleware", "Async/await", "Jest testing"],
-        commands=["/route", "/middleware", "/test-node"]
-    ),
-    "go": TechSpecialization(
-        name="Go",
-        keywords=["golang", "go.mod", "go.sum", ".go"],
-        capabilities=["Go idioms", "Goroutines/channels", "Go testing", "Error handling"],
-        commands=["/handler", "/test-go"]
-    ),
-    "rust": TechSpecialization(
-        name="Rust",
-        keywords=["rust", "cargo.toml", ".rs"],
-        capabilities=["Ownership/borrowing", "Error handling (Result)", "Async Rust", "Testing"],
-        commands=["/impl", "/test-rust"]
-    ),
-}
 
-# Data specializations
-DATA_SPECIALIZATIONS = {
-    "postgresql": TechSpecialization(
-        name="PostgreSQL",
-        keywords=["postgres", "postgresql", "psql", "pg_"],
-        capabilities=["Query optimization", "Indexing strategies", "Stored procedures", "JSONB"],
-        commands=["/query", "/index", "/explain"]
-    ),
-    "mongodb": TechSpecialization(
-        name="MongoDB",
-        keywords=["mongodb", "mongoose", "mongo"],
-        capabilities=["Aggregation pipelines", "Schema design", "Indexing", "Transactions"],
-        commands=["/aggregate", "/schema", "/index"]
-    ),
-    "redis": TechSpecialization(
-        name="Redis",
-        keywords=["redis", "ioredis", "redis-py"],
-        capabilities=["Caching patterns", "Pub/Sub", "Data structures", "Lua scripts"],
-        commands=["/cache", "/pubsub"]
-    ),
-    "elasticsearch": TechSpecialization(
-        name="Elasticsearch",
-        keywords=["elasticsearch", "elastic", "opensearch"],
-        capabilities=["Query DSL", "Mappings", "Aggregations", "Performance tuning"],
-        commands=["/search", "/mapping"]
-    ),
-    "sql": TechSpecialization(
-        name="SQL",
-        keywords=["sql", "mysql", "mariadb", "sqlite", ".sql"],
-        capabilities=["Query optimization", "Joins", "Indexing", "Transactions"],
-        commands=["/query", "/optimize"]
-    ),
-}
+def _category_specializations(expert_id: str) -> dict[str, TechSpecialization]:
+    """Get one expert's specializations, keyed by tech_id."""
+    return {tech_id: spec for (owner, tech_id), spec in SPECIALIZATIONS.items() if owner == expert_id}
 
-# DevOps specializations
-DEVOPS_SPECIALIZATIONS = {
-    "docker": TechSpecialization(
-        name="Docker",
-        keywords=["docker", "dockerfile", "docker-compose", "containerfile"],
-        capabilities=["Multi-stage builds", "Compose orchestration", "Security best practices", "Optimization"],
-        commands=["/dockerfile", "/compose"]
-    ),
-    "kubernetes": TechSpecialization(
-        name="Kubernetes",
-        keywords=["kubernetes", "k8s", "kubectl", "helm", "kustomize"],
-        capabilities=["Deployment strategies", "Services/Ingress", "ConfigMaps/Secrets", "Helm charts"],
-        commands=["/manifest", "/helm", "/debug-k8s"]
-    ),
-    "terraform": TechSpecialization(
-        name="Terraform",
-        keywords=["terraform", ".tf", "tfstate", "hcl"],
-        capabilities=["Module design", "State management", "Provider patterns", "Best practices"],
-        commands=["/resource", "/module"]
-    ),
-    "cicd": TechSpecialization(
-        name="CI/CD",
-        keywords=["github-actions", ".github/workflows", "gitlab-ci", "jenkins", "circleci"],
-        capabilities=["Pipeline design", "Testing stages", "Deployment automation", "Security scanning"],
-        commands=["/pipeline", "/workflow"]
-    ),
-    "ansible": TechSpecialization(
-        name="Ansible",
-        keywords=["ansible", "playbook", ".yml", "inventory"],
-        capabilities=["Playbook design", "Roles", "Inventory management", "Vault"],
-        commands=["/playbook", "/role"]
-    ),
-}
 
-# Mobile specializations
-MOBILE_SPECIALIZATIONS = {
-    "ios": TechSpecialization(
-        name="iOS/Swift",
-        keywords=["swift", "xcode", "cocoapods", "spm", ".swift", "xcodeproj"],
-        capabilities=["SwiftUI/UIKit", "Combine", "Core Data", "XCTest"],
-        commands=["/view", "/viewmodel", "/test-ios"]
-    ),
-    "android": TechSpecialization(
-        name="Android/Kotlin",
-        keywords=["kotlin", "android", "gradle", ".kt", "jetpack"],
-        capabilities=["Jetpack Compose", "Coroutines/Flow", "Room", "Android testing"],
-        commands=["/composable", "/viewmodel", "/test-android"]
-    ),
-    "flutter": TechSpecialization(
-        name="Flutter",
-        keywords=["flutter", "dart", "pubspec.yaml", ".dart"],
-        capabilities=["Widget patterns", "State management (Bloc/Riverpod)", "Platform channels", "Testing"],
-        commands=["/widget", "/bloc", "/test-flutter"]
-    ),
-    "reactnative": TechSpecialization(
-        name="React Native",
-        keywords=["react-native", "expo", "metro"],
-        capabilities=["Native modules", "Navigation", "State management", "Testing"],
-        commands=["/screen", "/hook", "/test-rn"]
-    ),
-}
+FRONTEND_SPECIALIZATIONS = _category_specializations("frontend-expert")
+BACKEND_SPECIALIZATIONS = _category_specializations("backend-expert")
+DATA_SPECIALIZATIONS = _category_specializations("data-expert")
+DEVOPS_SPECIALIZATIONS = _category_specializations("devops-expert")
+MOBILE_SPECIALIZATIONS = _category_specializations("mobile-expert")
+CLOUD_SPECIALIZATIONS = _category_specializations("cloud-expert")
 
-# Cloud specializations
-CLOUD_SPECIALIZATIONS = {
-    "aws": TechSpecialization(
-        name="AWS",
-        keywords=["aws", "lambda", "s3", "dynamodb", "cloudformation", "cdk", "sam"],
-        capabilities=["Lambda patterns", "API Gateway", "DynamoDB design", "CloudFormation/CDK"],
-        commands=["/lambda", "/cloudformation"]
-    ),
-    "gcp": TechSpecialization(
-        name="Google Cloud",
-        keywords=["gcp", "google-cloud", "cloud-functions", "firestore", "bigquery"],
-        capabilities=["Cloud Functions", "Firestore", "BigQuery", "Pub/Sub"],
-        commands=["/function", "/firestore"]
-    ),
-    "azure": TechSpecialization(
-        name="Azure",
-        keywords=["azure", "azure-functions", "cosmosdb", "arm-template"],
-        capabilities=["Azure Functions", "CosmosDB", "ARM templates", "Azure DevOps"],
-        commands=["/function", "/arm"]
-    ),
-    "serverless": TechSpecialization(
-        name="Serverless",
-        keywords=["serverless", "serverless.yml", "netlify", "vercel"],
-        capabilities=["Serverless patterns", "Cold start optimization", "Event-driven design"],
-        commands=["/function", "/serverless"]
-    ),
-}
+
+def _spec_keys(expert_id: str) -> tuple[tuple[str, str], ...]:
+    """Get the SPECIALIZATIONS keys of an expert, in declaration order."""
+    return tuple(key for key in SPECIALIZATIONS if key[0] == expert_id)
 
 
 # =============================================================================
 # EXPERT DEFINITIONS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExpertDefinition:
-    """Definition of a technical expert."""
+    """
+    Definition of a technical expert.
+
+    Like specialization keywords, detection_keywords must be lowercase.
+    """
     id: str
     name: str
     icon: str
     description: str
     category: str  # "technical" or "transversal"
-    detection_keywords: list[str]
-    detection_files: list[str]
-    specializations: dict[str, TechSpecialization]
-    base_capabilities: list[AgentCapability]
-
-
-TECHNICAL_EXPERTS = {
-    "frontend-expert": ExpertDefinition(
+    detection_keywords: tuple[str, ...]
+    detection_files: tuple[str, ...]
+    spec_keys: tuple[tuple[str, str], ...]  # Keys into SPECIALIZATIONS
+    base_capabilities: tuple[AgentCapability, ...]  # Full records, for display
+    # Hot scoring data, parallel to base_capabilities
+    capability_triggers: tuple[str, ...] = field(init=False, compare=False)  # Lowercased
+    capability_scores: array = field(init=False, compare=False)  # int8 priorities
+
+    def __post_init__(self):
+        assert all(k == k.lower() for k in self.detection_keywords), f"{self.id}: detection_keywords must be lowercase"
+        object.__setattr__(self, "detection_keywords", tuple(sys.intern(k) for k in self.detection_keywords))
+        object.__setattr__(self, "capability_triggers", tuple(
+            sys.intern(cap.trigger.lower()) for cap in self.base_capabilities
+        ))
+        object.__setattr__(self, "capability_scores", array("b", [cap.priority for cap in self.base_capabilities]))
+
+    def specs(self) -> list[TechSpecialization]:
+        """Get this expert's specializations, in declaration order."""
+        return [SPECIALIZATIONS[key] for key in self.spec_keys]
+
+    @property
+    def capability_mask(self) -> int:
+        """Bitmask of this agent's capability triggers (bits from TRIGGER_BITS)."""
+        return _capability_bits()[1][self.id]
+
+
+# Shared capability instances, keyed by their field values
+_CAP_CACHE: dict[tuple[str, str, str, int], AgentCapability] = {}
+
+
+def _cap(name: str, description: str, trigger: str, priority: int) -> AgentCapability:
+    """Return the shared AgentCapability for these values, creating it once."""
+    key = (name, description, trigger, priority)
+    cap = _CAP_CACHE.get(key)
+    if cap is None:
+        cap = _CAP_CACHE[key] = AgentCapability(name, description, sys.intern(trigger), priority)
+    return cap
+
+
+# Experts are built on first access (see get_expert)
+_TECH_FACTORIES = {
+    "frontend-expert": lambda: ExpertDefinition(
         id="frontend-expert",
         name="Frontend Expert",
         icon="🎨",
         description="Expert en développement frontend et interfaces utilisateur",
         category="technical",
-        detection_keywords=["react", "vue", "angular", "svelte", "frontend", "css", "tailwind", "scss"],
-        detection_files=["*.tsx", "*.jsx", "*.vue", "angular.json", "next.config.*", "vite.config.*"],
-        specializations=FRONTEND_SPECIALIZATIONS,
-        base_capabilities=[
-            AgentCapability("component-design", "Conception de composants réutilisables", "component", 9),
-            AgentCapability("state-management", "Gestion d'état et flux de données", "state", 8),
-            AgentCapability("performance", "Optimisation des performances frontend", "slow render", 8),
-            AgentCapability("accessibility", "Accessibilité (a11y) et bonnes pratiques", "accessibility", 7),
-            AgentCapability("testing", "Tests unitaires et d'intégration frontend", "test", 8),
-        ]
+        detection_keywords=("react", "vue", "angular", "svelte", "frontend", "css", "tailwind", "scss"),
+        detection_files=("*.tsx", "*.jsx", "*.vue", "angular.json", "next.config.*", "vite.config.*"),
+        spec_keys=_spec_keys("frontend-expert"),
+        base_capabilities=(
+            _cap("component-design", "Conception de composants réutilisables", "component", 9),
+            _cap("state-management", "Gestion d'état et flux de données", "state", 8),
+            _cap("performance", "Optimisation des performances frontend", "slow render", 8),
+            _cap("accessibility", "Accessibilité (a11y) et bonnes pratiques", "accessibility", 7),
+            _cap("testing", "Tests unitaires et d'intégration frontend", "test", 8),
+        )
     ),
-    "backend-expert": ExpertDefinition(
+    "backend-expert": lambda: ExpertDefinition(
         id="backend-expert",
         name="Backend Expert",
         icon="⚙️",
         description="Expert en développement backend et APIs",
         category="technical",
-        detection_keywords=["spring", "django", "fastapi", "express", "nestjs", "api", "rest", "graphql"],
-        detection_files=["pom.xml", "build.gradle", "requirements.txt", "go.mod", "Cargo.toml", "package.json"],
-        specializations=BACKEND_SPECIALIZATIONS,
-        base_capabilities=[
-            AgentCapability("api-design", "Conception d'APIs REST/GraphQL", "api", 9),
-            AgentCapability("database", "Intégration base de données et ORM", "database", 8),
-            AgentCapability("security", "Sécurité backend (auth, validation)", "security", 9),
-            AgentCapability("performance", "Optimisation des performances", "slow", 8),
-            AgentCapability("testing", "Tests unitaires et d'intégration", "test", 8),
-        ]
+        detection_keywords=("spring", "django", "fastapi", "express", "nestjs", "api", "rest", "graphql"),
+        detection_files=("pom.xml", "build.gradle", "requirements.txt", "go.mod", "Cargo.toml", "package.json"),
+        spec_keys=_spec_keys("backend-expert"),
+        base_capabilities=(
+            _cap("api-design", "Conception d'APIs REST/GraphQL", "api", 9),
+            _cap("database", "Intégration base de données et ORM", "database", 8),
+            _cap("security", "Sécurité backend (auth, validation)", "security", 9),
+            _cap("performance", "Optimisation des performances", "slow", 8),
+            _cap("testing", "Tests unitaires et d'intégration", "test", 8),
+        )
     ),
-    "data-expert": ExpertDefinition(
+    "data-expert": lambda: ExpertDefinition(
         id="data-expert",
         name="Data Expert",
         icon="🗄️",
         description="Expert en bases de données et gestion des données",
         category="technical",
-        detection_keywords=["postgres", "mongodb", "redis", "elasticsearch", "sql", "database", "etl"],
-        detection_files=["*.sql", "docker-compose.yml", "schema.prisma", "migrations/"],
-        specializations=DATA_SPECIALIZATIONS,
-        base_capabilities=[
-            AgentCapability("schema-design", "Conception de schémas de données", "schema", 9),
-            AgentCapability("query-optimization", "Optimisation des requêtes", "slow query", 9),
-            AgentCapability("indexing", "Stratégies d'indexation", "index", 8),
-            AgentCapability("migration", "Migrations de données", "migration", 7),
-            AgentCapability("backup", "Stratégies de backup/restore", "backup", 7),
-        ]
+        detection_keywords=("postgres", "mongodb", "redis", "elasticsearch", "sql", "database", "etl"),
+        detection_files=("*.sql", "docker-compose.yml", "schema.prisma", "migrations/"),
+        spec_keys=_spec_keys("data-expert"),
+        base_capabilities=(
+            _cap("schema-design", "Conception de schémas de données", "schema", 9),
+            _cap("query-optimization", "Optimisation des requêtes", "slow query", 9),
+            _cap("indexing", "Stratégies d'indexation", "index", 8),
+            _cap("migration", "Migrations de données", "migration", 7),
+            _cap("backup", "Stratégies de backup/restore", "backup", 7),
+        )
     ),
-    "devops-expert": ExpertDefinition(
+    "devops-expert": lambda: ExpertDefinition(
         id="devops-expert",
         name="DevOps Expert",
         icon="🚀",
         description="Expert en infrastructure, CI/CD et déploiement",
         category="technical",
-        detection_keywords=["docker", "kubernetes", "terraform", "ansible", "cicd", "pipeline", "helm"],
-        detection_files=["Dockerfile", "docker-compose.yml", "*.tf", ".github/workflows/*", "k8s/", "helm/"],
-        specializations=DEVOPS_SPECIALIZATIONS,
-        base_capabilities=[
-            AgentCapability("containerization", "Containerisation et orchestration", "docker", 9),
-            AgentCapability("ci-cd", "Pipelines CI/CD", "pipeline", 9),
-            AgentCapability("infrastructure", "Infrastructure as Code", "infra", 8),
-            AgentCapability("monitoring", "Monitoring et observabilité", "monitor", 8),
-            AgentCapability("security", "Sécurité DevOps (DevSecOps)", "security", 8),
-        ]
+        detection_keywords=("docker", "kubernetes", "terraform", "ansible", "cicd", "pipeline", "helm"),
+        detection_files=("Dockerfile", "docker-compose.yml", "*.tf", ".github/workflows/*", "k8s/", "helm/"),
+        spec_keys=_spec_keys("devops-expert"),
+        base_capabilities=(
+            _cap("containerization", "Containerisation et orchestration", "docker", 9),
+            _cap("ci-cd", "Pipelines CI/CD", "pipeline", 9),
+            _cap("infrastructure", "Infrastructure as Code", "infra", 8),
+            _cap("monitoring", "Monitoring et observabilité", "monitor", 8),
+            _cap("security", "Sécurité DevOps (DevSecOps)", "security", 8),
+        )
     ),
-    "mobile-expert": ExpertDefinition(
+    "mobile-expert": lambda: ExpertDefinition(
         id="mobile-expert",
         name="Mobile Expert",
         icon="📱",
         description="Expert en développement mobile (iOS, Android, Cross-platform)",
         category="technical",
-        detection_keywords=["ios", "android", "swift", "kotlin", "flutter", "react-native", "mobile"],
-        detection_files=["*.swift", "*.kt", "pubspec.yaml", "Podfile", "build.gradle"],
-        specializations=MOBILE_SPECIALIZATIONS,
-        base_capabilities=[
-            AgentCapability("ui-patterns", "Patterns UI mobile", "ui", 9),
-            AgentCapability("navigation", "Navigation et routing", "navigation", 8),
-            AgentCapability("state", "Gestion d'état mobile", "state", 8),
-            AgentCapability("platform", "Intégrations natives", "native", 7),
-            AgentCapability("testing", "Tests mobile", "test", 8),
-        ]
+        detection_keywords=("ios", "android", "swift", "kotlin", "flutter", "react-native", "mobile"),
+        detection_files=("*.swift", "*.kt", "pubspec.yaml", "Podfile", "build.gradle"),
+        spec_keys=_spec_keys("mobile-expert"),
+        base_capabilities=(
+            _cap("ui-patterns", "Patterns UI mobile", "ui", 9),
+            _cap("navigation", "Navigation et routing", "navigation", 8),
+            _cap("state", "Gestion d'état mobile", "state", 8),
+            _cap("platform", "Intégrations natives", "native", 7),
+            _cap("testing", "Tests mobile", "test", 8),
+        )
     ),
-    "cloud-expert": ExpertDefinition(
+    "cloud-expert": lambda: ExpertDefinition(
         id="cloud-expert",
         name="Cloud Expert",
         icon="☁️",
         description="Expert en services cloud et architectures serverless",
         category="technical",
-        detection_keywords=["aws", "gcp", "azure", "lambda", "serverless", "cloud"],
-        detection_files=["serverless.yml", "template.yaml", "cloudformation.yaml", "*.tf"],
-        specializations=CLOUD_SPECIALIZATIONS,
-        base_capabilities=[
-            AgentCapability("architecture", "Architecture cloud", "architecture", 9),
-            AgentCapability("serverless", "Patterns serverless", "serverless", 8),
-            AgentCapability("cost", "Optimisation des coûts", "cost", 7),
-            AgentCapability("security", "Sécurité cloud", "security", 9),
-            AgentCapability("scaling", "Auto-scaling et haute disponibilité", "scale", 8),
-        ]
+        detection_keywords=("aws", "gcp", "azure", "lambda", "serverless", "cloud"),
+        detection_files=("serverless.yml", "template.yaml", "cloudformation.yaml", "*.tf"),
+        spec_keys=_spec_keys("cloud-expert"),
+        base_capabilities=(
+            _cap("architecture", "Architecture cloud", "architecture", 9),
+            _cap("serverless", "Patterns serverless", "serverless", 8),
+            _cap("cost", "Optimisation des coûts", "cost", 7),
+            _cap("security", "Sécurité cloud", "security", 9),
+            _cap("scaling", "Auto-scaling et haute disponibilité", "scale", 8),
+        )
     ),
 }
 
@@ -369,116 +400,809 @@ TECHNICAL_EXPERTS = {
 # TRANSVERSAL ASSISTANT DEFINITIONS
 # =============================================================================
 
-TRANSVERSAL_ASSISTANTS = {
-    "security-checker": ExpertDefinition(
+_TRANS_FACTORIES = {
+    "security-checker": lambda: ExpertDefinition(
         id="security-checker",
         name="Security Checker",
         icon="🔒",
         description="Vérification de la sécurité du code et conformité",
         category="transversal",
-        detection_keywords=["security", "auth", "password", "token", "secret"],
-        detection_files=[".env", "auth/", "security/", "credentials"],
-        specializations={},
-        base_capabilities=[
-            AgentCapability("vulnerability-scan", "Détection de vulnérabilités OWASP", "security", 10),
-            AgentCapability("secrets-detection", "Détection de secrets exposés", "secret", 10),
-            AgentCapability("compliance-check", "Vérification de conformité", "compliance", 9),
-            AgentCapability("code-review-security", "Review sécurité du code", "review", 8),
-            AgentCapability("dependency-audit", "Audit des dépendances", "dependency", 8),
-        ]
+        detection_keywords=("security", "auth", "password", "token", "secret"),
+        detection_files=(".env", "auth/", "security/", "credentials"),
+        spec_keys=(),
+        base_capabilities=(
+            _cap("vulnerability-scan", "Détection de vulnérabilités OWASP", "security", 10),
+            _cap("secrets-detection", "Détection de secrets exposés", "secret", 10),
+            _cap("compliance-check", "Vérification de conformité", "compliance", 9),
+            _cap("code-review-security", "Review sécurité du code", "review", 8),
+            _cap("dependency-audit", "Audit des dépendances", "dependency", 8),
+        )
     ),
-    "onboarding-guide": ExpertDefinition(
+    "onboarding-guide": lambda: ExpertDefinition(
         id="onboarding-guide",
         name="Onboarding Guide",
         icon="📚",
         description="Aide à la montée en compétence sur le projet",
         category="transversal",
-        detection_keywords=["readme", "documentation", "getting-started"],
-        detection_files=["README.md", "CONTRIBUTING.md", "docs/"],
-        specializations={},
-        base_capabilities=[
-            AgentCapability("architecture-explain", "Explication de l'architecture", "architecture", 9),
-            AgentCapability("code-walkthrough", "Parcours guidé du code", "understand", 9),
-            AgentCapability("conventions", "Explication des conventions", "convention", 8),
-            AgentCapability("setup-guide", "Guide de configuration", "setup", 8),
-            AgentCapability("faq", "Réponses aux questions fréquentes", "question", 7),
-        ]
+        detection_keywords=("readme", "documentation", "getting-started"),
+        detection_files=("README.md", "CONTRIBUTING.md", "docs/"),
+        spec_keys=(),
+        base_capabilities=(
+            _cap("architecture-explain", "Explication de l'architecture", "architecture", 9),
+            _cap("code-walkthrough", "Parcours guidé du code", "understand", 9),
+            _cap("conventions", "Explication des conventions", "convention", 8),
+            _cap("setup-guide", "Guide de configuration", "setup", 8),
+            _cap("faq", "Réponses aux questions fréquentes", "question", 7),
+        )
     ),
-    "doc-generator": ExpertDefinition(
+    "doc-generator": lambda: ExpertDefinition(
         id="doc-generator",
         name="Doc Generator",
         icon="📝",
         description="Génération et amélioration de la documentation",
         category="transversal",
-        detection_keywords=["documentation", "readme", "api-doc"],
-        detection_files=["README.md", "docs/", "*.md"],
-        specializations={},
-        base_capabilities=[
-            AgentCapability("readme", "Génération de README", "readme", 9),
-            AgentCapability("api-docs", "Documentation API (OpenAPI/Swagger)", "api", 9),
-            AgentCapability("code-comments", "Commentaires de code", "comment", 7),
-            AgentCapability("changelog", "Génération de changelog", "changelog", 7),
-            AgentCapability("diagrams", "Génération de diagrammes", "diagram", 8),
-        ]
+        detection_keywords=("documentation", "readme", "api-doc"),
+        detection_files=("README.md", "docs/", "*.md"),
+        spec_keys=(),
+        base_capabilities=(
+            _cap("readme", "Génération de README", "readme", 9),
+            _cap("api-docs", "Documentation API (OpenAPI/Swagger)", "api", 9),
+            _cap("code-comments", "Commentaires de code", "comment", 7),
+            _cap("changelog", "Génération de changelog", "changelog", 7),
+            _cap("diagrams", "Génération de diagrammes", "diagram", 8),
+        )
     ),
-    "refactoring-advisor": ExpertDefinition(
+    "refactoring-advisor": lambda: ExpertDefinition(
         id="refactoring-advisor",
         name="Refactoring Advisor",
         icon="♻️",
         description="Conseil en refactoring et amélioration du code",
         category="transversal",
-        detection_keywords=["refactor", "legacy", "technical-debt", "cleanup"],
-        detection_files=[],
-        specializations={},
-        base_capabilities=[
-            AgentCapability("code-smells", "Détection de code smells", "smell", 9),
-            AgentCapability("patterns", "Suggestion de design patterns", "pattern", 8),
-            AgentCapability("solid", "Principes SOLID", "solid", 8),
-            AgentCapability("simplification", "Simplification du code", "complex", 8),
-            AgentCapability("modularization", "Découpage en modules", "module", 7),
-        ]
+        detection_keywords=("refactor", "legacy", "technical-debt", "cleanup"),
+        detection_files=(),
+        spec_keys=(),
+        base_capabilities=(
+            _cap("code-smells", "Détection de code smells", "smell", 9),
+            _cap("patterns", "Suggestion de design patterns", "pattern", 8),
+            _cap("solid", "Principes SOLID", "solid", 8),
+            _cap("simplification", "Simplification du code", "complex", 8),
+            _cap("modularization", "Découpage en modules", "module", 7),
+        )
     ),
-    "perf-optimizer": ExpertDefinition(
+    "perf-optimizer": lambda: ExpertDefinition(
         id="perf-optimizer",
         name="Performance Optimizer",
         icon="⚡",
         description="Optimisation des performances",
         category="transversal",
-        detection_keywords=["performance", "optimization", "slow", "cache", "profiling"],
-        detection_files=[],
-        specializations={},
-        base_capabilities=[
-            AgentCapability("profiling", "Analyse de performance", "slow", 9),
-            AgentCapability("caching", "Stratégies de cache", "cache", 9),
-            AgentCapability("lazy-loading", "Chargement différé", "lazy", 8),
-            AgentCapability("memory", "Optimisation mémoire", "memory", 8),
-            AgentCapability("database-perf", "Performance base de données", "query", 8),
-        ]
+        detection_keywords=("performance", "optimization", "slow", "cache", "profiling"),
+        detection_files=(),
+        spec_keys=(),
+        base_capabilities=(
+            _cap("profiling", "Analyse de performance", "slow", 9),
+            _cap("caching", "Stratégies de cache", "cache", 9),
+            _cap("lazy-loading", "Chargement différé", "lazy", 8),
+            _cap("memory", "Optimisation mémoire", "memory", 8),
+            _cap("database-perf", "Performance base de données", "query", 8),
+        )
     ),
-    "test-advisor": ExpertDefinition(
+    "test-advisor": lambda: ExpertDefinition(
         id="test-advisor",
         name="Test Advisor",
         icon="🧪",
         description="Conseil en stratégie de tests",
         category="transversal",
-        detection_keywords=["test", "testing", "coverage", "tdd", "bdd"],
-        detection_files=["tests/", "test/", "__tests__/", "*.test.*", "*.spec.*"],
-        specializations={},
-        base_capabilities=[
-            AgentCapability("unit-tests", "Tests unitaires", "unit", 9),
-            AgentCapability("integration-tests", "Tests d'intégration", "integration", 8),
-            AgentCapability("e2e-tests", "Tests end-to-end", "e2e", 8),
-            AgentCapability("mocking", "Stratégies de mocking", "mock", 8),
-            AgentCapability("coverage", "Amélioration de la couverture", "coverage", 8),
-        ]
+        detection_keywords=("test", "testing", "coverage", "tdd", "bdd"),
+        detection_files=("tests/", "test/", "__tests__/", "*.test.*", "*.spec.*"),
+        spec_keys=(),
+        base_capabilities=(
+            _cap("unit-tests", "Tests unitaires", "unit", 9),
+            _cap("integration-tests", "Tests d'intégration", "integration", 8),
+            _cap("e2e-tests", "Tests end-to-end", "e2e", 8),
+            _cap("mocking", "Stratégies de mocking", "mock", 8),
+            _cap("coverage", "Amélioration de la couverture", "coverage", 8),
+        )
     ),
 }
 
 
+# =============================================================================
+# DEFINITION REGISTRY
+# =============================================================================
+
+# Definitions are built from their factories on first access (well under a
+# millisecond for the whole catalog), so no serialized snapshot is shipped.
+@lru_cache(maxsize=None)
+def get_expert(expert_id: str) -> ExpertDefinition:
+    """Get an expert or assistant definition, building it on first access."""
+    factory = _TECH_FACTORIES.get(expert_id) or _TRANS_FACTORIES.get(expert_id)
+    if factory is None:
+        raise KeyError(expert_id)
+    return factory()
+
+
+def all_experts() -> dict[str, ExpertDefinition]:
+    """Get all technical experts, keyed by id."""
+    return {expert_id: get_expert(expert_id) for expert_id in _TECH_FACTORIES}
+
+
+def all_assistants() -> dict[str, ExpertDefinition]:
+    """Get all transversal assistants, keyed by id."""
+    return {assistant_id: get_expert(assistant_id) for assistant_id in _TRANS_FACTORIES}
+
+
+class ExpertId(IntEnum):
+    """Integer ids of all agents: technical experts first, then assistants."""
+    FRONTEND = 0
+    BACKEND = 1
+    DATA = 2
+    DEVOPS = 3
+    MOBILE = 4
+    CLOUD = 5
+    SECURITY = 6
+    ONBOARDING = 7
+    DOC = 8
+    REFACTORING = 9
+    PERF = 10
+    TEST = 11
+
+    @property
+    def slug(self) -> str:
+        """The string id of this agent (e.g. "frontend-expert")."""
+        return _EXPERT_SLUGS[self]
+
+
+# String id per ExpertId value, in declaration order of the factories
+_EXPERT_SLUGS = (*_TECH_FACTORIES, *_TRANS_FACTORIES)
+assert len(_EXPERT_SLUGS) == len(ExpertId)
+
+# String id -> ExpertId, for callers holding string ids
+EXPERT_ID_BY_STRING = MappingProxyType({slug: ExpertId(i) for i, slug in enumerate(_EXPERT_SLUGS)})
+
+
+# Module attributes materialized on first access
+_LAZY_ATTRIBUTES = {
+    "TECHNICAL_EXPERTS": all_experts,
+    "TRANSVERSAL_ASSISTANTS": all_assistants,
+    # All definitions, indexed by ExpertId
+    "EXPERTS": lambda: tuple(get_expert(slug) for slug in _EXPERT_SLUGS),
+}
+
+
+def __getattr__(name: str) -> Any:
+    builder = _LAZY_ATTRIBUTES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+# =============================================================================
+# KEYWORD DETECTION
+# =============================================================================
+
+def canonicalize(text: str) -> str:
+    """
+    Fold text into the form catalog keywords and triggers are declared in.
+
+    That form is plain str.lower(): keywords keep their separators
+    ("next.js", "react-native"), so none are normalized away here.
+    """
+    return text.lower()
+
+
+@lru_cache(maxsize=1)
+def _keyword_index() -> MappingProxyType:
+    """
+    Build the inverted index: keyword -> (expert_id, tech_id) postings.
+
+    Covers specialization keywords and each agent's detection_keywords; the
+    latter are posted with tech_id None.
+    """
+    index: dict[str, list[tuple[str, str | None]]] = {}
+    for experts in (all_experts(), all_assistants()):
+        for expert_id, expert in experts.items():
+            for key in expert.spec_keys:
+                for keyword in SPECIALIZATIONS[key].keyword_order:
+                    index.setdefault(keyword, []).append(key)
+            for keyword in expert.detection_keywords:
+                index.setdefault(keyword, []).append((expert_id, None))
+    return MappingProxyType({keyword: tuple(postings) for keyword, postings in index.items()})
+
+
+_LAZY_ATTRIBUTES["KEYWORD_INDEX"] = _keyword_index
+
+
+@lru_cache(maxsize=1)
+def _keyword_table() -> tuple[MappingProxyType, tuple[tuple[tuple[str, str | None], ...], ...]]:
+    """Assign each indexed keyword a dense id (sorted order) and lay postings out by id."""
+    keywords = sorted(_keyword_index())
+    ids = MappingProxyType({keyword: i for i, keyword in enumerate(keywords)})
+    return ids, tuple(_keyword_index()[keyword] for keyword in keywords)
+
+
+def keyword_id(keyword: str) -> int | None:
+    """Get the dense id of a lowercased keyword, or None if it is not indexed."""
+    return _keyword_table()[0].get(keyword)
+
+
+_LAZY_ATTRIBUTES["KEYWORD_IDS"] = lambda: _keyword_table()[0]
+_LAZY_ATTRIBUTES["_SPEC_TABLE"] = lambda: _keyword_table()[1]
+
+
+def _specialization_keywords() -> dict[str, list[tuple[str, str]]]:
+    """Map each lowercased specialization keyword to its (expert_id, tech_id) tags."""
+    tags: dict[str, list[tuple[str, str]]] = {}
+    for keyword, postings in _keyword_index().items():
+        spec_postings = [posting for posting in postings if posting[1] is not None]
+        if spec_postings:
+            tags[keyword] = spec_postings
+    return tags
+
+
+@lru_cache(maxsize=1)
+def _keyword_automaton():
+    """
+    Build one Aho-Corasick automaton over every specialization keyword.
+
+    Returns None when pyahocorasick is not installed. Cached: call
+    _keyword_automaton.cache_clear() to rebuild after changing the catalog.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in _specialization_keywords().items():
+        automaton.add_word(keyword, tuple(tags))
+    automaton.make_automaton()
+    return automaton
+
+
+def _hyperscan_literal(keyword: str) -> bytes:
+    """Escape a keyword's UTF-8 bytes so hyperscan matches it literally."""
+    return b"".join(
+        bytes((byte,)) if chr(byte).isalnum() and byte < 0x80 else b"\\x%02x" % byte
+        for byte in keyword.encode("utf-8")
+    )
+
+
+@lru_cache(maxsize=1)
+def _keyword_database():
+    """
+    Compile every specialization keyword into one hyperscan database.
+
+    Returns (database, tags per pattern id), or None when hyperscan is not
+    installed; hyperscan is only imported on the first scan. Cached like
+    _keyword_automaton.
+    """
+    try:
+        import hyperscan
+    except ImportError:  # Optional: SIMD keyword scanning, else Aho-Corasick
+        return None
+    keywords = _specialization_keywords()
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[_hyperscan_literal(keyword) for keyword in keywords],
+        ids=list(range(len(keywords))),
+        elements=len(keywords),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords),
+    )
+    return database, tuple(tuple(tags) for tags in keywords.values())
+
+
+_scratch = threading.local()
+
+
+def _thread_scratch(database):
+    """Get this thread's hyperscan scratch space: one scratch can't serve concurrent scans."""
+    cached = getattr(_scratch, "pair", None)
+    if cached is None or cached[0] is not database:
+        import hyperscan
+        cached = _scratch.pair = (database, hyperscan.Scratch(database))
+    return cached[1]
+
+
+def _match_with_hyperscan(text: str) -> dict[str, set[str]] | None:
+    """Scan text with the hyperscan database; None when unavailable or text isn't valid UTF-8."""
+    compiled = _keyword_database()
+    if compiled is None:
+        return None
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:  # Lone surrogates: leave it to the str-based paths
+        return None
+    database, id_to_tags = compiled
+    hits: dict[str, set[str]] = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        for expert_id, tech_id in id_to_tags[pattern_id]:
+            hits.setdefault(expert_id, set()).add(tech_id)
+
+    database.scan(data, match_event_handler=on_match, scratch=_thread_scratch(database))
+    return hits
+
+
+def _match_with_automaton(text: str) -> dict[str, set[str]] | None:
+    """Scan text with the Aho-Corasick automaton; None without pyahocorasick."""
+    automaton = _keyword_automaton()
+    if automaton is None:
+        return None
+    hits: dict[str, set[str]] = {}
+    for _, tags in automaton.iter(text):
+        for expert_id, tech_id in tags:
+            hits.setdefault(expert_id, set()).add(tech_id)
+    return hits
+
+
+def _match_with_substrings(text: str) -> dict[str, set[str]]:
+    """Check every specialization keyword against text, one substring test each."""
+    hits: dict[str, set[str]] = {}
+    for keyword, tags in _specialization_keywords().items():
+        if keyword in text:
+            for expert_id, tech_id in tags:
+                hits.setdefault(expert_id, set()).add(tech_id)
+    return hits
+
+
+def match_specializations(text: str) -> dict[str, set[str]]:
+    """
+    Find every specialization with a keyword occurring in text.
+
+    Args:
+        text: Text already passed through canonicalize
+
+    Returns:
+        Mapping of expert_id -> set of matched tech_ids
+    """
+    hits = _match_with_hyperscan(text)
+    if hits is None:
+        hits = _match_with_automaton(text)
+    if hits is None:
+        hits = _match_with_substrings(text)
+    return hits
+
+
+def _detection_keywords() -> dict[str, tuple[str, ...]]:
+    """Map each detection keyword to the ids of the agents declaring it."""
+    owners: dict[str, tuple[str, ...]] = {}
+    for keyword, postings in _keyword_index().items():
+        agent_ids = tuple(expert_id for expert_id, tech_id in postings if tech_id is None)
+        if agent_ids:
+            owners[keyword] = agent_ids
+    return owners
+
+
+@lru_cache(maxsize=1)
+def _detection_automaton():
+    """Build one Aho-Corasick automaton over every detection keyword (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, agent_ids in _detection_keywords().items():
+        automaton.add_word(keyword, (keyword, agent_ids))
+    automaton.make_automaton()
+    return automaton
+
+
+def match_detection_keywords(text: str) -> dict[str, set[str]]:
+    """
+    Find, in one pass, the detection keywords of every agent occurring in text.
+
+    Args:
+        text: Text already passed through canonicalize
+
+    Returns:
+        Mapping of agent_id -> set of matched detection keywords
+    """
+    hits: dict[str, set[str]] = {}
+    automaton = _detection_automaton()
+    if automaton is not None:
+        for _, (keyword, agent_ids) in automaton.iter(text):
+            for agent_id in agent_ids:
+                hits.setdefault(agent_id, set()).add(keyword)
+        return hits
+
+    for keyword, agent_ids in _detection_keywords().items():
+        if keyword in text:
+            for agent_id in agent_ids:
+                hits.setdefault(agent_id, set()).add(keyword)
+    return hits
+
+
+@lru_cache(maxsize=1)
+def _keyword_trie():
+    """Build a prefix trie over every indexed keyword (marisa-trie when installed)."""
+    keywords = list(_keyword_index())
+    if marisa_trie is not None:
+        return marisa_trie.Trie(keywords)
+
+    root: dict = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[None] = keyword  # End of keyword marker
+    return root
+
+
+def keyword_prefixes(token: str) -> list[str]:
+    """
+    Return the indexed keywords that are prefixes of a token, shortest first.
+
+    Lets detection map e.g. "springboot2" or "react-native-web" back to the
+    keywords it starts with in O(len(token)), whatever the keyword count.
+
+    Args:
+        token: Already lowercased token
+    """
+    trie = _keyword_trie()
+    if not isinstance(trie, dict):
+        return trie.prefixes(token)
+
+    found = []
+    node = trie
+    for char in token:
+        node = node.get(char)
+        if node is None:
+            break
+        if None in node:
+            found.append(node[None])
+    return found
+
+
+def _detection_file_regex(pattern: str) -> str:
+    """
+    Translate a detection_files glob into a regex matched against a whole path.
+
+    The glob may match at any directory level; a trailing "/" marks a
+    directory, matching any path inside it.
+    """
+    if pattern.endswith("/"):
+        pattern += "*"
+    return r"(?:.*/)?" + fnmatch.translate(pattern)
+
+
+@lru_cache(maxsize=1)
+def _detection_file_patterns() -> dict[ExpertId, re.Pattern]:
+    """Compile each agent's detection_files into one alternation, per agent."""
+    patterns = {}
+    for experts in (all_experts(), all_assistants()):
+        for expert_id, expert in experts.items():
+            if expert.detection_files:
+                patterns[EXPERT_ID_BY_STRING[expert_id]] = re.compile(
+                    "|".join(_detection_file_regex(p) for p in expert.detection_files)
+                )
+    return patterns
+
+
+@lru_cache(maxsize=8192)
+def classify_path(path: str) -> frozenset[ExpertId]:
+    """
+    Return the ExpertIds of the agents whose detection_files match a file path.
+
+    Memoized per path (extensions and file names repeat heavily across a
+    repository); call classify_path.cache_clear() after changing the catalog.
+
+    Args:
+        path: Path relative to the repository root ("/" or "\\" separators)
+    """
+    path = path.replace("\\", "/")
+    return frozenset(
+        expert_id for expert_id, pattern in _detection_file_patterns().items()
+        if pattern.match(path)
+    )
+
+
+# =============================================================================
+# CAPABILITY SCORING
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _capability_bits() -> tuple[dict[str, int], dict[str, int], dict[str, array]]:
+    """
+    Assign one bit per distinct capability trigger across the catalog.
+
+    Returns (trigger -> bit, agent_id -> capability mask,
+    agent_id -> int8 priority per bit).
+    """
+    agents = {**all_experts(), **all_assistants()}
+    bits: dict[str, int] = {}
+    for agent in agents.values():
+        for trigger in agent.capability_triggers:
+            bits.setdefault(trigger, len(bits))
+
+    masks: dict[str, int] = {}
+    score_vecs: dict[str, array] = {}
+    for agent_id, agent in agents.items():
+        mask = 0
+        score_vec = array("b", [0]) * len(bits)
+        for trigger, priority in zip(agent.capability_triggers, agent.capability_scores):
+            bit = bits[trigger]
+            mask |= 1 << bit
+            score_vec[bit] = priority
+        masks[agent_id] = mask
+        score_vecs[agent_id] = score_vec
+
+    return bits, masks, score_vecs
+
+
+_LAZY_ATTRIBUTES["TRIGGER_BITS"] = lambda: MappingProxyType(_capability_bits()[0])
+
+
+def fired_trigger_mask(text: str) -> int:
+    """
+    Compute the bitmask of capability triggers occurring in a text.
+
+    Args:
+        text: Text already passed through canonicalize (e.g. joined pain points)
+    """
+    mask = 0
+    for trigger, bit in _capability_bits()[0].items():
+        if trigger in text:
+            mask |= 1 << bit
+    return mask
+
+
+def capability_score(agent_id: str, fired_mask: int) -> int:
+    """Sum the priorities of an agent's capabilities whose trigger bit is set in fired_mask."""
+    _, masks, score_vecs = _capability_bits()
+    score_vec = score_vecs[agent_id]
+    hits = masks[agent_id] & fired_mask
+    total = 0
+    while hits:
+        lowest = hits & -hits
+        total += score_vec[lowest.bit_length() - 1]
+        hits ^= lowest
+    return total
+
+
+@lru_cache(maxsize=1)
+def _score_matrix():
+    """
+    Stack every agent's per-bit priorities into an (agents x bits) int8 matrix.
+
+    Returns (numpy module, matrix), or None when numpy is not installed; numpy
+    is only imported on the first score_all_experts call.
+    """
+    try:
+        import numpy as np
+    except ImportError:  # Optional: score_all_experts falls back to per-agent sums
+        return None
+    score_vecs = _capability_bits()[2]
+    return np, np.array(list(score_vecs.values()), dtype=np.int8)
+
+
+_LAZY_ATTRIBUTES["EXPERT_IDS_ORDER"] = lambda: tuple(_capability_bits()[2])
+
+
+def score_all_experts(fired_mask: int):
+    """
+    Score every expert and assistant against a fired trigger mask at once.
+
+    Returns one capability score per agent, in EXPERT_IDS_ORDER order (so
+    also indexable by ExpertId): a numpy array when numpy is installed, a
+    list otherwise.
+    """
+    compiled = _score_matrix()
+    if compiled is None:
+        return [capability_score(agent_id, fired_mask) for agent_id in _capability_bits()[2]]
+
+    np, matrix = compiled
+    n_bits = matrix.shape[1]
+    raw = np.frombuffer(fired_mask.to_bytes((n_bits + 7) // 8, "little"), dtype=np.uint8)
+    bits = np.unpackbits(raw, bitorder="little")[:n_bits]
+    return matrix @ bits.astype(np.int16)  # int16 product: sums can exceed int8
+
+
+# =============================================================================
+# CATALOG QUERIES
+# =============================================================================
+# Definitions are frozen, so these are memoized for the life of the process.
+
+@lru_cache(maxsize=None)
+def experts_matching_keyword(keyword: str) -> tuple[str, ...]:
+    """Get the ids of the agents declaring a lowercased keyword (detection or specialization)."""
+    postings = _keyword_index().get(keyword, ())
+    return tuple(dict.fromkeys(expert_id for expert_id, _ in postings))
+
+
+@lru_cache(maxsize=None)
+def commands_for(expert_id: str) -> tuple[str, ...]:
+    """Get the slash commands suggested by an expert's specializations, without duplicates."""
+    return tuple(dict.fromkeys(
+        command for spec in get_expert(expert_id).specs() for command in spec.commands
+    ))
+
+
+@lru_cache(maxsize=None)
+def all_keywords_by_category(category: str) -> tuple[str, ...]:
+    """Get every keyword of the agents in a category ("technical" or "transversal")."""
+    keywords: dict[str, None] = {}
+    for slug in _EXPERT_SLUGS:
+        expert = get_expert(slug)
+        if expert.category != category:
+            continue
+        keywords.update(dict.fromkeys(expert.detection_keywords))
+        for spec in expert.specs():
+            keywords.update(dict.fromkeys(spec.keyword_order))
+    return tuple(keywords)
+
+
 # =============================================================================
 # CATALOG V2 CLASS
 # =============================================================================
 
+@dataclass(slots=True)
+class _ScoringContext:
+    """Canonicalized texts of one profile/assessment pair, built once per get_recommendations call."""
+    profile: ProjectProfile
+    assessment: NeedsAssessment
+    profile_text: str  # Stack, patterns, features, description
+    spec_text: str  # Stack, patterns, dependencies, raw content
+    spec_hits: dict[str, set[str]]  # Specializations matched in spec_text, per expert
+    profile_pain_text: str  # Profile pain points, description
+    pain_text: str  # Assessment pain points
+    experience_text: str  # Assessment experience level
+    profile_keyword_hits: dict[str, set[str]]  # Detection keywords in profile_text, per agent
+    pain_keyword_hits: dict[str, set[str]]  # Detection keywords in profile_pain_text, per agent
+    pain_trigger_mask: int  # Capability trigger bits fired by pain_text
+    stack_agents: tuple[tuple[str, frozenset[str]], ...]  # Stack entry, agents with a detection keyword in it
+
+    @classmethod
+    def build(cls, profile: ProjectProfile, assessment: NeedsAssessment) -> "_ScoringContext":
+        profile_text = canonicalize(" ".join([
+            " ".join(profile.stack),
+            " ".join(profile.patterns),
+            " ".join(profile.features),
+            profile.description,
+        ]))
+        profile_pain_text = canonicalize(" ".join([
+            " ".join(profile.pain_points),
+            profile.description,
+        ]))
+        spec_text = canonicalize(" ".join([
+            " ".join(profile.stack),
+            " ".join(profile.patterns),
+            " ".join(profile.dependencies),
+            profile.raw_content
+        ]))
+        pain_text = canonicalize(" ".join(assessment.main_pain_points))
+        return cls(
+            profile=profile,
+            assessment=assessment,
+            profile_text=profile_text,
+            spec_text=spec_text,
+            spec_hits=match_specializations(spec_text),
+            profile_pain_text=profile_pain_text,
+            pain_text=pain_text,
+            experience_text=canonicalize(assessment.experience_level),
+            profile_keyword_hits=match_detection_keywords(profile_text),
+            pain_keyword_hits=match_detection_keywords(profile_pain_text),
+            pain_trigger_mask=fired_trigger_mask(pain_text),
+            stack_agents=tuple(
+                (entry, frozenset(match_detection_keywords(canonicalize(entry))))
+                for entry in profile.stack
+            ),
+        )
+
+
+# Pain-point words that trigger an assistant, one alternation per assistant
+_PAIN_PATTERNS = {
+    assistant_id: re.compile("|".join(map(re.escape, words)))
+    for assistant_id, words in (
+        ("doc-generator", ("documentation", "doc")),
+        ("refactoring-advisor", ("dette", "legacy", "refactor")),
+        ("perf-optimizer", ("performance", "lent", "slow")),
+        ("test-advisor", ("test", "coverage")),
+    )
+}
+
+
+# Project complexities that call for onboarding support
+_HIGH_MED_COMPLEXITY = frozenset({"high", "medium"})
+
+
+# Assessment-side score of each transversal assistant (see calculate_assistant_score)
+def _score_security(ctx: _ScoringContext) -> float:
+    score = 0.0
+    if ctx.assessment.sensitive_data:
+        score += 0.5
+    if ctx.assessment.compliance_requirements:
+        score += 0.3
+    return score
+
+
+def _score_onboarding(ctx: _ScoringContext) -> float:
+    score = 0.0
+    if "mixte" in ctx.experience_text:
+        score += 0.3
+    if "junior" in ctx.experience_text:
+        score += 0.4
+    if ctx.profile.complexity in _HIGH_MED_COMPLEXITY:
+        score += 0.2
+    return score
+
+
+def _score_docs(ctx: _ScoringContext) -> float:
+    if _PAIN_PATTERNS["doc-generator"].search(ctx.pain_text):
+        return 0.5
+    return 0.0
+
+
+def _score_refactoring(ctx: _ScoringContext) -> float:
+    score = 0.0
+    if _PAIN_PATTERNS["refactoring-advisor"].search(ctx.pain_text):
+        score += 0.5
+    if ctx.profile.complexity == "high":
+        score += 0.2
+    return score
+
+
+def _score_perf(ctx: _ScoringContext) -> float:
+    if _PAIN_PATTERNS["perf-optimizer"].search(ctx.pain_text):
+        return 0.5
+    return 0.0
+
+
+def _score_tests(ctx: _ScoringContext) -> float:
+    if _PAIN_PATTERNS["test-advisor"].search(ctx.pain_text):
+        return 0.5
+    return 0.0
+
+
+_ASSISTANT_SCORERS = {
+    "security-checker": _score_security,
+    "onboarding-guide": _score_onboarding,
+    "doc-generator": _score_docs,
+    "refactoring-advisor": _score_refactoring,
+    "perf-optimizer": _score_perf,
+    "test-advisor": _score_tests,
+}
+
+
+# Justification reasons of each transversal assistant (see _generate_justification)
+def _justify_security(profile: ProjectProfile, assessment: NeedsAssessment) -> list[str]:
+    reasons = []
+    if assessment.sensitive_data:
+        reasons.append("Données sensibles détectées")
+    if assessment.compliance_requirements:
+        reasons.append(f"Compliance requise: {', '.join(assessment.compliance_requirements)}")
+    return reasons
+
+
+def _justify_onboarding(profile: ProjectProfile, assessment: NeedsAssessment) -> list[str]:
+    reasons = [f"Niveau équipe: {assessment.experience_level}"]
+    if profile.complexity in _HIGH_MED_COMPLEXITY:
+        reasons.append(f"Complexité projet: {profile.complexity}")
+    return reasons
+
+
+def _justify_tests(profile: ProjectProfile, assessment: NeedsAssessment) -> list[str]:
+    return ["Tests identifiés comme besoin"]
+
+
+def _justify_perf(profile: ProjectProfile, assessment: NeedsAssessment) -> list[str]:
+    return ["Performance identifiée comme priorité"]
+
+
+_ASSISTANT_JUSTIFIERS = {
+    "security-checker": _justify_security,
+    "onboarding-guide": _justify_onboarding,
+    "test-advisor": _justify_tests,
+    "perf-optimizer": _justify_perf,
+}
+
+
+# Fixed parts of CatalogV2.format_recommendations output
+_RECOMMENDATIONS_HEADER = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    AGENTS IA RECOMMANDÉS                                     ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+_SECTION_RULE = "─" * 60 + "\n"
+_RECOMMENDATIONS_FOOTER = "\n" + "═" * 60
+_PRIORITY_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+
+
 class CatalogV2:
     """
     Enhanced catalog with dynamic recommendations.
@@ -487,9 +1211,15 @@ class CatalogV2:
     contextual recommendations based on project analysis.
     """
 
+    # Max (profile, assessment, min_score) entries kept in the recommendation cache
+    CACHE_SIZE = 128
+
     def __init__(self):
-        self.technical_experts = TECHNICAL_EXPERTS
-        self.transversal_assistants = TRANSVERSAL_ASSISTANTS
+        self._cache = RecommendationCache(self.CACHE_SIZE)
+        self.technical_experts = all_experts()
+        self.transversal_assistants = all_assistants()
+        self._all_agents = {**self.technical_experts, **self.transversal_assistants}
+        self._agent_icons = {agent_id: agent.icon for agent_id, agent in self._all_agents.items()}
 
     def get_all_experts(self) -> dict[str, ExpertDefinition]:
         """Get all technical experts."""
@@ -501,12 +1231,12 @@ class CatalogV2:
 
     def get_all_agents(self) -> dict[str, ExpertDefinition]:
         """Get all agents (experts + assistants)."""
-        return {**self.technical_experts, **self.transversal_assistants}
+        return self._all_agents
 
     def detect_specializations(
         self,
         expert_id: str,
-        profile: ProjectProfile
+        ctx: _ScoringContext
     ) -> list[TechSpecialization]:
         """
         Detect which specializations apply to this project.
@@ -514,73 +1244,54 @@ class CatalogV2:
         Returns list of relevant specializations based on project stack.
         """
         expert = self.technical_experts.get(expert_id)
-        if not expert or not expert.specializations:
+        if not expert or not expert.spec_keys:
             return []
 
-        detected = []
-        profile_text = " ".join([
-            " ".join(profile.stack),
-            " ".join(profile.patterns),
-            " ".join(profile.dependencies),
-            profile.raw_content.lower() if profile.raw_content else ""
-        ]).lower()
-
-        for spec_id, spec in expert.specializations.items():
-            for keyword in spec.keywords:
-                if keyword.lower() in profile_text:
-                    detected.append(spec)
-                    break  # One match is enough
+        matched = ctx.spec_hits.get(expert_id, ())
+        return [SPECIALIZATIONS[key] for key in expert.spec_keys if key[1] in matched]
 
-        return detected
+    def _keyword_component(self, expert: ExpertDefinition, ctx: _ScoringContext) -> float:
+        """Score an expert's detection keywords found in the profile (0.4 max)."""
+        # Already restricted to this expert's (lowercase, unique) detection keywords
+        found = ctx.profile_keyword_hits.get(expert.id, ())
+        return min(0.4, len(found) * 0.1)
 
     def calculate_expert_score(
         self,
         expert: ExpertDefinition,
-        profile: ProjectProfile,
-        assessment: NeedsAssessment
+        ctx: _ScoringContext,
+        specs: list[TechSpecialization],
+        keyword_score: float | None = None
     ) -> float:
         """
         Calculate relevance score for a technical expert.
 
+        specs are the expert's detected specializations (see detect_specializations);
+        keyword_score is its precomputed _keyword_component, if the caller has it.
+
         Score is based on:
         - Detection keywords found in profile (0.4 max)
         - Specializations detected (0.4 max)
         - Assessment alignment (0.2 max)
         """
-        score = 0.0
-
         # Check detection keywords
-        profile_text = " ".join([
-            " ".join(profile.stack),
-            " ".join(profile.patterns),
-            " ".join(profile.features),
-            profile.description,
-        ]).lower()
-
-        keyword_matches = sum(1 for kw in expert.detection_keywords if kw.lower() in profile_text)
-        if keyword_matches > 0:
-            score += min(0.4, keyword_matches * 0.1)
+        score = keyword_score if keyword_score is not None else self._keyword_component(expert, ctx)
 
         # Check specializations
-        specs = self.detect_specializations(expert.id, profile)
         if specs:
             score += min(0.4, len(specs) * 0.15)
 
         # Assessment alignment
-        if assessment.main_pain_points:
-            pain_text = " ".join(assessment.main_pain_points).lower()
-            for cap in expert.base_capabilities:
-                if cap.trigger.lower() in pain_text:
-                    score += 0.1
-                    break
+        if ctx.assessment.main_pain_points:
+            if expert.capability_mask & ctx.pain_trigger_mask:
+                score += 0.1
 
         return min(score, 1.0)
 
     def calculate_assistant_score(
         self,
         assistant: ExpertDefinition,
-        profile: ProjectProfile,
-        assessment: NeedsAssessment
+        ctx: _ScoringContext
     ) -> float:
         """
         Calculate relevance score for a transversal assistant.
@@ -589,108 +1300,100 @@ class CatalogV2:
         - Assessment triggers (0.6 max)
         - Profile analysis (0.4 max)
         """
-        score = 0.0
-
         # Assessment-based scoring
-        if assistant.id == "security-checker":
-            if assessment.sensitive_data:
-                score += 0.5
-            if assessment.compliance_requirements:
-                score += 0.3
-
-        elif assistant.id == "onboarding-guide":
-            if "mixte" in assessment.experience_level.lower():
-                score += 0.3
-            if "junior" in assessment.experience_level.lower():
-                score += 0.4
-            if profile.complexity in ["high", "medium"]:
-                score += 0.2
-
-        elif assistant.id == "doc-generator":
-            pain_text = " ".join(assessment.main_pain_points).lower()
-            if "documentation" in pain_text or "doc" in pain_text:
-                score += 0.5
-
-        elif assistant.id == "refactoring-advisor":
-            pain_text = " ".join(assessment.main_pain_points).lower()
-            if "dette" in pain_text or "legacy" in pain_text or "refactor" in pain_text:
-                score += 0.5
-            if profile.complexity == "high":
-                score += 0.2
-
-        elif assistant.id == "perf-optimizer":
-            pain_text = " ".join(assessment.main_pain_points).lower()
-            if "performance" in pain_text or "lent" in pain_text or "slow" in pain_text:
-                score += 0.5
-
-        elif assistant.id == "test-advisor":
-            pain_text = " ".join(assessment.main_pain_points).lower()
-            if "test" in pain_text or "coverage" in pain_text:
-                score += 0.5
+        scorer = _ASSISTANT_SCORERS.get(assistant.id)
+        score = scorer(ctx) if scorer else 0.0
 
         # Profile-based bonus
-        profile_text = " ".join([
-            " ".join(profile.pain_points),
-            profile.description,
-        ]).lower()
-
+        found = ctx.pain_keyword_hits.get(assistant.id, ())
         for keyword in assistant.detection_keywords:
-            if keyword.lower() in profile_text:
+            if keyword in found:
                 score += 0.1
 
         return min(score, 1.0)
 
+    def _score_experts(
+        self,
+        ctx: _ScoringContext,
+        min_score: float
+    ) -> list[tuple[str, ExpertDefinition, float, list[TechSpecialization]]]:
+        """Score the technical experts, keeping (id, expert, score, specs) of those reaching min_score."""
+        scored = []
+        for expert_id, expert in self.technical_experts.items():
+            # Skip experts that cannot reach min_score even with full
+            # specialization (0.4) and assessment (0.1) components
+            keyword_score = self._keyword_component(expert, ctx)
+            if keyword_score + 0.4 + 0.1 < min_score:
+                continue
+
+            # Detect specializations for this project
+            specs = self.detect_specializations(expert_id, ctx)
+            score = self.calculate_expert_score(expert, ctx, specs, keyword_score)
+            if score >= min_score:
+                scored.append((expert_id, expert, score, specs))
+        return scored
+
     def get_recommendations(
         self,
         profile: ProjectProfile,
         assessment: NeedsAssessment,
-        min_score: float = 0.2
+        min_score: float = 0.2,
+        top_k: int | None = None
     ) -> list[AgentRecommendation]:
         """
         Generate dynamic recommendations based on project analysis.
 
         Returns all agents with score >= min_score, sorted by score.
-        No artificial limit on number of recommendations.
+        No artificial limit on number of recommendations unless top_k is given.
         """
+        recommendations = self._cache.get_or_compute(
+            (profile, assessment, min_score),
+            lambda: self._compute_recommendations(profile, assessment, min_score)
+        )
+        return recommendations[:top_k]
+
+    def _compute_recommendations(
+        self,
+        profile: ProjectProfile,
+        assessment: NeedsAssessment,
+        min_score: float
+    ) -> list[AgentRecommendation]:
+        """Score and rank every agent (uncached get_recommendations)."""
         recommendations = []
+        ctx = _ScoringContext.build(profile, assessment)
 
         # Score technical experts
-        for expert_id, expert in self.technical_experts.items():
-            score = self.calculate_expert_score(expert, profile, assessment)
-
-            if score >= min_score:
-                # Detect specializations for this project
-                specs = self.detect_specializations(expert_id, profile)
-                spec_names = [s.name for s in specs]
-
-                # Build dynamic name with specializations
-                if spec_names:
-                    display_name = f"{expert.name} ({'/'.join(spec_names[:2])})"
-                else:
-                    display_name = expert.name
-
-                # Generate justification
-                justification = self._generate_justification(expert, profile, assessment, score, specs)
-
-                # Priority based on score
-                priority = "high" if score >= 0.6 else "medium" if score >= 0.4 else "low"
-
-                recommendations.append(AgentRecommendation(
-                    agent_type=expert_id,
-                    name=display_name,
-                    description=expert.description,
-                    priority=priority,
-                    justification=justification,
-                    capabilities=expert.base_capabilities.copy(),
-                    match_score=score
-                ))
+        for expert_id, expert, score, specs in self._score_experts(ctx, min_score):
+            spec_names = [s.name for s in specs]
+
+            # Build dynamic name with specializations
+            if spec_names:
+                display_name = f"{expert.name} ({'/'.join(spec_names[:2])})"
+            else:
+                display_name = expert.name
+
+            # Generate justification
+            justification = self._generate_justification(expert, ctx, score, specs)
+
+            # Priority based on score
+            priority = "high" if score >= 0.6 else "medium" if score >= 0.4 else "low"
+
+            recommendations.append(AgentRecommendation(
+                agent_type=expert_id,
+                name=display_name,
+                description=expert.description,
+                priority=priority,
+                justification=justification,
+                capabilities=expert.base_capabilities,
+                match_score=score
+            ))
 
         # Score transversal assistants
         for assistant_id, assistant in self.transversal_assistants.items():
-            score = self.calculate_assistant_score(assistant, profile, assessment)
+            score = self.calculate_assistant_score(assistant, ctx)
 
             if score >= min_score:
-                justification = self._generate_justification(assistant, profile, assessment, score, [])
+                justification = self._generate_justification(assistant, ctx, score, [])
                 priority = "high" if score >= 0.6 else "medium" if score >= 0.4 else "low"
 
                 recommendations.append(AgentRecommendation(
@@ -699,20 +1402,19 @@ class CatalogV2:
                     description=assistant.description,
                     priority=priority,
                     justification=justification,
-                    capabilities=assistant.base_capabilities.copy(),
+                    capabilities=assistant.base_capabilities,
                     match_score=score
                 ))
 
         # Sort by score (highest first)
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
+        recommendations.sort(key=attrgetter("match_score"), reverse=True)
 
         return recommendations
 
     def _generate_justification(
         self,
         agent: ExpertDefinition,
-        profile: ProjectProfile,
-        assessment: NeedsAssessment,
+        ctx: _ScoringContext,
         score: float,
         specializations: list[TechSpecialization]
     ) -> str:
@@ -725,29 +1427,14 @@ class CatalogV2:
                 reasons.append(f"Technologies détectées: {', '.join(spec_names)}")
 
             # Stack match
-            stack_matches = [s for s in profile.stack if any(
-                kw.lower() in s.lower() for kw in agent.detection_keywords
-            )]
+            stack_matches = [entry for entry, agent_ids in ctx.stack_agents if agent.id in agent_ids]
             if stack_matches:
                 reasons.append(f"Stack correspondante: {', '.join(stack_matches[:2])}")
 
         else:  # Transversal
-            if agent.id == "security-checker":
-                if assessment.sensitive_data:
-                    reasons.append("Données sensibles détectées")
-                if assessment.compliance_requirements:
-                    reasons.append(f"Compliance requise: {', '.join(assessment.compliance_requirements)}")
-
-            elif agent.id == "onboarding-guide":
-                reasons.append(f"Niveau équipe: {assessment.experience_level}")
-                if profile.complexity in ["high", "medium"]:
-                    reasons.append(f"Complexité projet: {profile.complexity}")
-
-            elif agent.id == "test-advisor":
-                reasons.append("Tests identifiés comme besoin")
-
-            elif agent.id == "perf-optimizer":
-                reasons.append("Performance identifiée comme priorité")
+            justifier = _ASSISTANT_JUSTIFIERS.get(agent.id)
+            if justifier:
+                reasons.extend(justifier(ctx.profile, ctx.assessment))
 
         if not reasons:
             reasons.append(f"Score de correspondance: {score:.0%}")
@@ -765,27 +1452,23 @@ class CatalogV2:
         technical = [r for r in recommendations if r.agent_type in self.technical_experts]
         transversal = [r for r in recommendations if r.agent_type in self.transversal_assistants]
 
-        output = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    AGENTS IA RECOMMANDÉS                                     ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-"""
+        parts = [_RECOMMENDATIONS_HEADER]
 
         if technical:
-            output += "\n📦 EXPERTS TECHNIQUES\n"
-            output += "─" * 60 + "\n"
+            parts.append("\n📦 EXPERTS TECHNIQUES\n")
+            parts.append(_SECTION_RULE)
             for i, rec in enumerate(technical, 1):
-                output += self._format_single_recommendation(i, rec, show_capabilities)
+                parts.append(self._format_single_recommendation(i, rec, show_capabilities))
 
         if transversal:
-            output += "\n🔧 ASSISTANTS TRANSVERSAUX\n"
-            output += "─" * 60 + "\n"
+            parts.append("\n🔧 ASSISTANTS TRANSVERSAUX\n")
+            parts.append(_SECTION_RULE)
             start_idx = len(technical) + 1
             for i, rec in enumerate(transversal, start_idx):
-                output += self._format_single_recommendation(i, rec, show_capabilities)
+                parts.append(self._format_single_recommendation(i, rec, show_capabilities))
 
-        output += "\n" + "═" * 60
-        return output
+        parts.append(_RECOMMENDATIONS_FOOTER)
+        return "".join(parts)
 
     def _format_single_recommendation(
         self,
@@ -794,27 +1477,23 @@ class CatalogV2:
         show_capabilities: bool
     ) -> str:
         """Format a single recommendation."""
-        icon = self.get_all_agents().get(rec.agent_type, {})
-        if isinstance(icon, ExpertDefinition):
-            icon = icon.icon
-        else:
-            icon = "🤖"
+        icon = self._agent_icons.get(rec.agent_type, "🤖")
 
-        priority_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}[rec.priority]
+        priority_icon = _PRIORITY_ICONS[rec.priority]
 
-        output = f"""
+        parts = [f"""
 {index}. {icon} {rec.name} {priority_icon} [{rec.priority.upper()}]
    {rec.description}
 
    📋 Justification: {rec.justification}
-"""
+"""]
 
         if show_capabilities and rec.capabilities:
-            output += "\n   🛠️  Capacités:\n"
+            parts.append("\n   🛠️  Capacités:\n")
             for cap in rec.capabilities[:4]:
-                output += f"      • {cap.name}: {cap.description}\n"
+                parts.append(f"      • {cap.name}: {cap.description}\n")
 
-        return output
+        return "".join(parts)
 
 
 # =============================================================================
@@ -0,0 +1,67 @@
+"""
+Parity tests for catalog_v2 keyword matching.
+
+match_specializations picks hyperscan, then Aho-Corasick, then plain substring
+checks depending on what is installed: every backend must find the same hits.
+"""
+
+import random
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import catalog_v2
+from generators.catalog_v2 import canonicalize, match_specializations
+
+
+def _sample_texts() -> list[str]:
+    """Texts built from catalog keywords, with noise, accents and a lone surrogate."""
+    rnd = random.Random(7)
+    keywords = sorted(catalog_v2._specialization_keywords())
+    noise = ["", " ", "\n", "é", "données", "-", "/", "ü", " ", "x\udcff "]
+    texts = ["", "aucun mot clé ici", "x\udcff react", "Projet React + Django sur AWS"]
+    for _ in range(200):
+        words = rnd.sample(keywords, rnd.randint(1, 8)) + rnd.sample(noise, 3)
+        rnd.shuffle(words)
+        texts.append(canonicalize(rnd.choice([" ", "", ", "]).join(words)))
+    return texts
+
+
+class MatchSpecializationsParityTest(unittest.TestCase):
+    def setUp(self):
+        self.texts = _sample_texts()
+
+    def test_automaton_matches_substrings(self):
+        if catalog_v2._keyword_automaton() is None:
+            self.skipTest("pyahocorasick not installed")
+        for text in self.texts:
+            self.assertEqual(
+                catalog_v2._match_with_automaton(text),
+                catalog_v2._match_with_substrings(text),
+                repr(text),
+            )
+
+    def test_hyperscan_matches_substrings(self):
+        if catalog_v2._keyword_database() is None:
+            self.skipTest("hyperscan not installed")
+        for text in self.texts:
+            expected = catalog_v2._match_with_substrings(text)
+            hits = catalog_v2._match_with_hyperscan(text)
+            if hits is None:  # Not encodable: must fall through, not raise
+                self.assertRaises(UnicodeEncodeError, text.encode, "utf-8")
+                hits = match_specializations(text)
+            self.assertEqual(hits, expected, repr(text))
+
+    def test_concurrent_scans(self):
+        expected = [catalog_v2._match_with_substrings(text) for text in self.texts]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(5):
+                self.assertEqual(list(pool.map(match_specializations, self.texts)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
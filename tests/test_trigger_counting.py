@@ -0,0 +1,74 @@
+"""
+Parity tests for agent_builder trigger counting.
+
+The numpy and numba paths only kick in for large catalogs, so the tests lower
+their thresholds and check them against the plain substring loop.
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import agent_builder
+from generators.agent_builder import _TRIGGERS_LOWER, _count_agent_hits, _count_text_hits
+
+
+def _sample_texts() -> list[str]:
+    """Texts built from catalog triggers, with noise, accents, a lone surrogate and a long one."""
+    rnd = random.Random(11)
+    triggers = sorted({trigger for agent_triggers in _TRIGGERS_LOWER.values() for trigger in agent_triggers})
+    noise = ["", " ", "\n", "é", "données", "-", "ü", "x\udcff ", "stack", "complexe"]
+    texts = ["", "rien à signaler", "x\udcff tests", "logs errors", " ".join(triggers) * 40]
+    for _ in range(200):
+        words = rnd.sample(triggers, rnd.randint(1, 6)) + rnd.sample(noise, 3)
+        rnd.shuffle(words)
+        texts.append(rnd.choice([" ", "", ", "]).join(words))
+    return texts
+
+
+def _expected(text: str) -> list[int]:
+    return [_count_agent_hits(agent_type, text) for agent_type in _TRIGGERS_LOWER]
+
+
+class CountTextHitsParityTest(unittest.TestCase):
+    def setUp(self):
+        self.texts = _sample_texts()
+        self._min_agents = agent_builder._VECTORIZE_MIN_AGENTS
+        self._min_triggers = agent_builder._JIT_MIN_TRIGGERS
+
+    def tearDown(self):
+        agent_builder._VECTORIZE_MIN_AGENTS = self._min_agents
+        agent_builder._JIT_MIN_TRIGGERS = self._min_triggers
+        agent_builder._trigger_matrix.cache_clear()
+        agent_builder._trigger_scanner.cache_clear()
+
+    def test_substring_loop_by_default(self):
+        for text in self.texts:
+            self.assertEqual(_count_text_hits(text), _expected(text), repr(text))
+
+    def test_numpy_matrix_matches_substrings(self):
+        agent_builder._VECTORIZE_MIN_AGENTS = 0
+        agent_builder._trigger_matrix.cache_clear()
+        if agent_builder._trigger_matrix() is None:
+            self.skipTest("numpy not installed")
+        for text in self.texts:
+            self.assertEqual(_count_text_hits(text), _expected(text), repr(text))
+
+    def test_numba_scanner_matches_substrings(self):
+        agent_builder._JIT_MIN_TRIGGERS = 0
+        agent_builder._trigger_scanner.cache_clear()
+        scanner = agent_builder._trigger_scanner()
+        if scanner is None:
+            self.skipTest("numba not installed")
+        for text in self.texts:
+            self.assertEqual(_count_text_hits(text), _expected(text), repr(text))
+            if len(text) <= agent_builder._JIT_MAX_TEXT and "\udcff" not in text:
+                self.assertEqual(scanner(text), _expected(text), repr(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
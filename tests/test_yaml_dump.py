@@ -0,0 +1,90 @@
+"""
+Round-trip tests for agent_builder._fast_yaml_dump.
+
+Whatever the hand-written quoting picks (plain, JSON-quoted or literal block),
+yaml.safe_load must read back the exact same data.
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+import yaml
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators.agent_builder import _fast_yaml_dump
+
+RULES_FILE = Path(__file__).parent.parent / "knowledge" / "rules" / "bpce-group-rules.yaml"
+
+# Fragments mixing YAML indicators, whitespace, line breaks and characters
+# YAML normalizes or rejects (C1 controls, BOM, line separators, surrogates)
+_FRAGMENTS = [
+    "a", "b", "x", "é", " ", "  ", "\t", "\n", "\n\n", "\r", "-", ":", "#", "'", '"',
+    "|", ">", "%", "{", "[", "\x7f", "\x85", "\ufeff", "\u2028", "\u2029", "\udcff",
+]
+
+
+def _random_string(rnd: random.Random) -> str:
+    return "".join(rnd.choice(_FRAGMENTS) for _ in range(rnd.randint(0, 12)))
+
+
+def _random_data(rnd: random.Random, depth: int = 0):
+    roll = rnd.random()
+    if depth < 3 and roll < 0.3:
+        return {_random_string(rnd) or "k": _random_data(rnd, depth + 1) for _ in range(rnd.randint(0, 3))}
+    if depth < 3 and roll < 0.5:
+        return [_random_data(rnd, depth + 1) for _ in range(rnd.randint(0, 3))]
+    return _random_string(rnd)
+
+
+class FastYamlDumpRoundTripTest(unittest.TestCase):
+    def assertRoundTrips(self, data):
+        dumped = _fast_yaml_dump(data)
+        self.assertEqual(yaml.safe_load(dumped), data, dumped)
+
+    def test_reserved_words_and_scalars(self):
+        self.assertRoundTrips({
+            "words": ["yes", "No", "on", "OFF", "null", "true", "False", "y", "n", "~", ""],
+            "numbers": [0, -3, 1.5, 1e20, "12", "1.0", "0x1f", "1_000"],
+            "flags": [True, False, None],
+            "text": ["plain text", "a: b", "- item", "#comment", "'quoted'", '"quoted"'],
+        })
+
+    def test_multiline_strings(self):
+        self.assertRoundTrips({
+            "clip": "ligne 1\nligne 2\n",
+            "strip": "ligne 1\nligne 2",
+            "keep": "ligne 1\n\n\n",
+            "blank_inside": "a\n\nb\n",
+            "leading_space": "  indenté\nsuite",
+            "whitespace_line": "a\n   \nb",
+            "nested": [{"message": "⚠️ ALERTE\nRéférence: {{id}}\n"}],
+        })
+
+    def test_control_and_bom_characters(self):
+        self.assertRoundTrips({
+            "controls": ["\x00", "\x07", "\x1b[0m", "\x7f", "\x85", "\x9f"],
+            "bom": ["\ufeff", "\ufeffdébut", "a\ufeff\nb"],
+            "separators": ["\u2028", "a\u2029b", "a\r\nb", "tab\there"],
+        })
+
+    def test_random_data(self):
+        rnd = random.Random(3)
+        for _ in range(5000):
+            data = _random_data(rnd)
+            try:
+                repr(data).encode("utf-8")
+            except UnicodeEncodeError:
+                continue  # Lone surrogates: safe_load can't compare them to str input
+            self.assertRoundTrips(data)
+
+    def test_rules_file(self):
+        with RULES_FILE.open(encoding="utf-8") as f:
+            self.assertRoundTrips(yaml.safe_load(f))
+
+
+if __name__ == "__main__":
+    unittest.main()